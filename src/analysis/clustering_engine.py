@@ -3,16 +3,48 @@ Clustering Engine - Groups ticker analyses into bullish/bearish clusters
 Calculates success probabilities and pattern classifications
 """
 
+import heapq
+import re
 from datetime import datetime
+from functools import lru_cache
 from config.settings import CONFIDENCE_THRESHOLD
 
+# Common confidence/probability shapes such as "75", "75%", "7.5" or "75% - note"
+_INT_TEXT_RE = re.compile(r'\s*([-+]?\d+)(?:\.\d*)?%?(?:\s.*)?', re.S).fullmatch
+
 def safe_int(value):
     """Safely convert any value to integer, handling strings, percentages, quotes"""
+    # Plain numbers skip the text round trip (floats only where str() would not use exponent form)
+    if type(value) is int:
+        return value
+    if type(value) is float and 1e-4 <= abs(value) < 1e16:
+        return int(value)
+    return _parse_int_text(str(value))
+
+@lru_cache(maxsize=4096)
+def _parse_int_text(text):
+    """Parse the text of a confidence/probability value; the same few strings recur across analyses"""
+    match = _INT_TEXT_RE(text)
+    if match:
+        return int(match.group(1))
     try:
-        return int(str(value).replace('%', '').replace('"', '').replace("'", '').split('.')[0].split()[0] or 0)
+        return int(text.replace('%', '').replace('"', '').replace("'", '').split('.')[0].split()[0] or 0)
     except (ValueError, TypeError):
         return 0
 
+def _sum_by_slot(slots, size, weights=None):
+    """Count rows (or sum integer weights) per slot index, vectorized with NumPy when available"""
+    try:
+        import numpy as np
+    except ImportError:
+        totals = [0] * size
+        for row, slot in enumerate(slots):
+            totals[slot] += 1 if weights is None else weights[row]
+        return totals
+    totals = np.bincount(np.asarray(slots, dtype=np.intp), weights=weights, minlength=size)
+    # Weighted bincount returns floats; the weights here are always whole numbers
+    return totals.astype(np.int64).tolist()
+
 class ClusteringEngine:
     def __init__(self):
         self.confidence_threshold = CONFIDENCE_THRESHOLD
@@ -238,31 +270,14 @@ class ClusteringEngine:
     
     def get_high_conviction_trades(self, clusters, max_count=5):
         """Extract highest conviction trades from clusters"""
-        high_conviction = []
-        
-        # Get top bullish trades
-        bullish_sorted = sorted(
-            clusters["bullish_group"]["tickers"],
-            key=lambda x: safe_int(x["confidence"]) * safe_int(x["success_probability"]),
-            reverse=True
-        )
-        
-        # Get top bearish trades
-        bearish_sorted = sorted(
-            clusters["bearish_group"]["tickers"],
-            key=lambda x: safe_int(x["confidence"]) * safe_int(x["success_probability"]),
-            reverse=True
-        )
-        
-        # Combine and select top trades
-        all_trades = bullish_sorted + bearish_sorted
-        all_trades_sorted = sorted(
-            all_trades,
-            key=lambda x: safe_int(x["confidence"]) * safe_int(x["success_probability"]),
-            reverse=True
-        )
-        
-        return all_trades_sorted[:max_count]
+        # Bullish trades first, then bearish, so equal scores keep that order in the ranking
+        all_trades = clusters["bullish_group"]["tickers"] + clusters["bearish_group"]["tickers"]
+
+        # Parse each trade's confidence x success probability once rather than per sort pass
+        scores = [safe_int(t["confidence"]) * safe_int(t["success_probability"]) for t in all_trades]
+        top = heapq.nlargest(max_count, range(len(all_trades)), key=scores.__getitem__)
+
+        return [all_trades[i] for i in top]
 
     def _group_by_ticker(self, all_analyses):
         """Group analyses by ticker symbol for multi-timeframe analysis"""
@@ -404,31 +419,43 @@ class ClusteringEngine:
         """Generate statistics for each timeframe across all tickers"""
         timeframe_stats = {}
 
-        # Collect all unique timeframes
-        all_timeframes = set()
-        for ticker_data in ticker_groups.values():
-            all_timeframes.update(ticker_data.keys())
+        # Collect all unique timeframes and give each one a slot index
+        all_timeframes = sorted({dte for ticker_data in ticker_groups.values() for dte in ticker_data})
+        slot_of = {dte: slot for slot, dte in enumerate(all_timeframes)}
+
+        # Flatten every analysis once, classifying and parsing it a single time
+        slots = []
+        bullish_flags = []
+        bearish_flags = []
+        confidences = []
+        for timeframe_data in ticker_groups.values():
+            for dte, analysis in timeframe_data.items():
+                classification = self._classify_analysis(analysis)
+                slots.append(slot_of[dte])
+                bullish_flags.append(int(classification == "bullish"))
+                bearish_flags.append(int(classification == "bearish"))
+                confidences.append(safe_int(analysis.get("pattern_analysis", {}).get("confidence_score", 0)))
+
+        # Aggregate per timeframe in one grouped pass per column
+        size = len(all_timeframes)
+        totals = _sum_by_slot(slots, size)
+        bullish_counts = _sum_by_slot(slots, size, bullish_flags)
+        bearish_counts = _sum_by_slot(slots, size, bearish_flags)
+        confidence_sums = _sum_by_slot(slots, size, confidences)
 
         # Analyze each timeframe
-        for dte in sorted(all_timeframes):
-            timeframe_analyses = []
-
-            for ticker, timeframe_data in ticker_groups.items():
-                if dte in timeframe_data:
-                    timeframe_analyses.append(timeframe_data[dte])
-
-            if timeframe_analyses:
-                bullish_count = sum(1 for a in timeframe_analyses if self._classify_analysis(a) == "bullish")
-                bearish_count = sum(1 for a in timeframe_analyses if self._classify_analysis(a) == "bearish")
-                avg_confidence = sum(safe_int(a.get("pattern_analysis", {}).get("confidence_score", 0)) for a in timeframe_analyses) / len(timeframe_analyses)
-
-                timeframe_stats[str(dte)] = {
-                    "total_signals": len(timeframe_analyses),
-                    "bullish_signals": bullish_count,
-                    "bearish_signals": bearish_count,
-                    "bullish_percentage": (bullish_count / len(timeframe_analyses) * 100) if timeframe_analyses else 0,
-                    "avg_confidence": avg_confidence,
-                    "market_bias": "bullish" if bullish_count > bearish_count else "bearish" if bearish_count > bullish_count else "mixed"
-                }
+        for slot, dte in enumerate(all_timeframes):
+            total = totals[slot]
+            bullish_count = bullish_counts[slot]
+            bearish_count = bearish_counts[slot]
+
+            timeframe_stats[str(dte)] = {
+                "total_signals": total,
+                "bullish_signals": bullish_count,
+                "bearish_signals": bearish_count,
+                "bullish_percentage": bullish_count / total * 100,
+                "avg_confidence": confidence_sums[slot] / total,
+                "market_bias": "bullish" if bullish_count > bearish_count else "bearish" if bearish_count > bullish_count else "mixed"
+            }
 
         return timeframe_stats
\ No newline at end of file
@@ -303,13 +303,11 @@ class OIPatternTracker:
             # Phase 6: Output Generation
             print("\nPhase 6: Dashboard & Report Generation")
             
-            # Generate HTML dashboard
-            dashboard_path = self.html_generator.generate_daily_dashboard(clusters, market_context)
+            # Generate HTML dashboard and JSON reports concurrently
+            dashboard_path, json_reports = self.html_generator.generate_outputs(clusters, analyses, market_context)
             if dashboard_path:
                 print(f"HTML dashboard: {dashboard_path}")
             
-            # Generate JSON reports
-            json_reports = self.html_generator.generate_json_reports(clusters, analyses)
             if json_reports:
                 print(f"JSON reports: {len(json_reports)} files generated")
             
@@ -4,15 +4,44 @@ Uses Jinja2 templates to generate professional trading dashboards
 """
 
 import os
+import gzip
+import hashlib
+import heapq
 import json
+import re
+import shutil
+import concurrent.futures
+import multiprocessing
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime
-from jinja2 import Template, Environment
+from itertools import chain
+from operator import itemgetter
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+
+# Common confidence/probability shapes such as "75", "75%", "7.5" or "75% - note"; anything
+# else falls back to the general cleaning in _parse_int_text
+_INT_TEXT_RE = re.compile(r'\s*([-+]?\d+)(?:\.\d*)?%?(?:\s.*)?', re.S).fullmatch
 
 def safe_int(value):
     """Safely convert any value to integer, handling strings, percentages, quotes"""
+    # Plain numbers skip the text round trip (floats only where str() would not use exponent form)
+    if type(value) is int:
+        return value
+    if type(value) is float and 1e-4 <= abs(value) < 1e16:
+        return int(value)
+    return _parse_int_text(str(value))
+
+@lru_cache(maxsize=4096)
+def _parse_int_text(text):
+    """Parse the text of a confidence/probability value; the same few strings recur across trades"""
+    match = _INT_TEXT_RE(text)
+    if match:
+        return int(match.group(1))
     try:
         # Handle various formats: "75%", "75% - comment", 75, "75"
-        clean_value = str(value).replace('%', '').replace('"', '').replace("'", '').strip()
+        clean_value = text.replace('%', '').replace('"', '').replace("'", '').strip()
         # Take only the first number if there's additional text
         number_part = clean_value.split()[0] if clean_value else '0'
         # Remove decimal part if present
@@ -23,9 +52,14 @@ def safe_int(value):
 
 def safe_float(value, decimals=2):
     """Safely convert any value to float with formatting"""
+    return _format_float_text(str(value), decimals)
+
+@lru_cache(maxsize=4096)
+def _format_float_text(text, decimals):
+    """Parse and format the text of a price-like value, cached on (text, decimals)"""
     try:
         # Handle various formats and clean the value
-        clean_value = str(value).replace('$', '').replace('%', '').replace('"', '').replace("'", '').strip()
+        clean_value = text.replace('$', '').replace('%', '').replace('"', '').replace("'", '').strip()
         # Take only the first number if there's additional text
         number_part = clean_value.split()[0] if clean_value else '0'
         result = float(number_part)
@@ -46,34 +80,667 @@ def number_format(value):
     except (ValueError, TypeError):
         return str(value) if value is not None else "0"
 
+# Matches plain numeric prices such as "1.25", "-0.5", ".5" or "42"
+_NUM_RE = re.compile(r'-?\d*\.?\d+').fullmatch
+
+def _fmt_price(value):
+    """Format numeric prices as dollars, passing descriptive text through unchanged"""
+    return f"${safe_float(value)}" if _NUM_RE(str(value)) else value
+
+def _featured_trade(trade, direction):
+    """Featured-card dict for one clustered trade"""
+    return {
+        "ticker": trade["ticker"],
+        "pattern_type": _pretty_pattern(trade["pattern_type"]),
+        "direction": direction,
+        "confidence": f"{trade['_conf_int']}%",
+        "entry": _fmt_price(trade["entry"]),
+        "target": _fmt_price(trade["target"]),
+        "stop_loss": _fmt_price(trade["stop_loss"]),
+        "risk_reward": trade["risk_reward"],
+        "expiry": trade["expiry"],
+        "dte": trade["dte"],
+        "success_prob": f"{trade['_sp_int']}%",
+        "current_price": trade["current_price"],
+        "supporting_evidence": trade["supporting_evidence"][:4],  # Top 4 evidence points
+        "timeframe_confluence": trade.get("timeframe_confluence", "Multi-timeframe aligned"),
+        "entry_triggers": trade.get("entry_triggers", ["Price confirmation", "Volume spike"]),
+        "technical_levels": trade.get("technical_levels", {}),
+        "volatility_regime": trade.get("volatility_regime", "Medium volatility"),
+        "institutional_flow": trade.get("institutional_flow", "Smart money positioning"),
+        "smart_money_thesis": trade.get("smart_money_thesis", "Institutional positioning detected"),
+        "smart_money_insights": trade.get("smart_money_insights", {})
+    }
+
+@lru_cache(maxsize=256)
+def _pretty_pattern(pattern_type):
+    """Display form of a pattern type, e.g. gamma_squeeze_setup -> Gamma Squeeze Setup"""
+    return pattern_type.replace("_", " ").title()
+
+def _order_desc(keys):
+    """Indices that order integer keys from highest to lowest, keeping ties in input order"""
+    # NumPy is imported lazily so small runs don't pay its start-up cost
+    try:
+        import numpy as np
+    except ImportError:
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=True)
+    arr = np.fromiter(keys, dtype=np.int64, count=len(keys))
+    return np.argsort(-arr, kind="stable").tolist()
+
+def _mean(values):
+    """Arithmetic mean of a non-empty list of integers"""
+    try:
+        import numpy as np
+    except ImportError:
+        return sum(values) / len(values)
+    return float(np.fromiter(values, dtype=np.int64, count=len(values)).mean())
+
+# Pattern type substrings that imply a trade direction, checked in order
+_PATTERN_DIR_RULES = (
+    ("accumulation", "bullish"),
+    ("squeeze", "bullish"),
+    ("distribution", "bearish"),
+    ("hedging", "bearish"),
+)
+
+# Ranking used to order options signals by strength
+_STRENGTH_SCORE = {"Strong": 3, "Moderate": 2, "Weak": 1}
+
+# Presentation labels resolved in Python so the template only interpolates them
+_CONFLUENCE_HEADERS = {
+    "aligned": "✅ TIMEFRAME ALIGNED",
+    "divergent": "⚠️ CONFLICTING SIGNALS",
+}
+_CONFLUENCE_STATUS_LABELS = {
+    "aligned": "✅ ALIGNED",
+    "divergent": "⚠️ DIVERGENT",
+}
+
+@lru_cache(maxsize=1)
+def _canonical_dumps():
+    """Return a deterministic, bytes-producing JSON serializer for hashing, preferring orjson when installed"""
+    try:
+        import orjson
+        options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        return lambda obj: orjson.dumps(obj, option=options, default=str)
+    except ImportError:
+        return _sorted_json_dumps
+
+def _sorted_json_dumps(obj):
+    """Stdlib fallback for _canonical_dumps"""
+    try:
+        return json.dumps(obj, sort_keys=True, default=str).encode('utf-8')
+    except TypeError:
+        # Mixed int/str keys can't be sorted; insertion order is still stable for identical inputs
+        return json.dumps(obj, default=str).encode('utf-8')
+
+@lru_cache(maxsize=1)
+def _report_dumps():
+    """Return a bytes-producing JSON serializer for the reports, preferring orjson when installed"""
+    # Imported lazily so runs that never write JSON don't pay for it
+    try:
+        import orjson
+        # Non-string keys are stringified like the stdlib fallback does instead of raising
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return lambda obj: orjson.dumps(obj, option=options, default=str)
+    except ImportError:
+        return _indented_json_dumps
+
+def _indented_json_dumps(obj):
+    """Stdlib fallback for _report_dumps"""
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+def _content_hash(obj):
+    """Short content hash of JSON-able data, used to detect inputs that have not changed since the last run"""
+    return hashlib.blake2b(_canonical_dumps()(obj), digest_size=8).hexdigest()
+
+# Row fragments for the flat, repetitive dashboard sections, filled with Markup.format_map
+# (which escapes every field) and joined in Python instead of looping in the template
+_SIGNAL_ITEM_HTML = Markup(
+    '<div class="signal-item">'
+    '<div class="signal-item-head">'
+    '<span class="signal-ticker">{ticker}</span>'
+    '<span class="signal-strength">{signal_strength}</span>'
+    '</div>'
+    '<div class="signal-meta">{meta}{bias}{walls}</div>'
+    '</div>\n'
+)
+_SIGNAL_BIAS_HTML = Markup('<br><span class="signal-bias">{}</span>')
+_SIGNAL_WALLS_HTML = Markup('<br><span class="signal-walls">Put Walls: {}</span>')
+_SIGNAL_META_HTML = Markup("P/C: {pc_ratio} | {pattern}")
+_SPREAD_META_HTML = Markup("Max Pain: {max_pain_level} | Safety: {safety_margin}")
+
+# Squeeze direction styling keyed by whether price sits above the gamma flip point
+_SQUEEZE_STYLES = {
+    True: ("Upward", "bullish", "#00ff88", "↗"),
+    False: ("Downward", "bearish", "#ff4444", "↘")
+}
+
+_GAMMA_TABLE_HEAD = Markup(
+    '<table class="gamma-table">\n<thead>\n<tr>'
+    '<th>Ticker</th><th>Current Price</th><th>Gamma Flip Point</th><th>Distance</th>'
+    '<th>Squeeze Direction</th><th>Risk Level</th><th>Net Exposure</th><th>Volatility Impact</th>'
+    '<th>Pattern</th><th>Confidence</th>'
+    '</tr>\n</thead>\n<tbody>\n'
+)
+_GAMMA_TABLE_TAIL = Markup('</tbody>\n</table>')
+
+_GAMMA_ROW_HTML = Markup(
+    '<tr>'
+    '<td class="ticker-cell">{ticker}</td>'
+    '<td>{current_price}</td>'
+    '<td><div class="flip-point-indicator">{flip_point} '
+    '<span class="flip-arrow" style="color: {direction_color};">{direction_arrow}</span></div></td>'
+    '<td>{flip_distance}</td>'
+    '<td><span class="squeeze-direction {direction_class}">{squeeze_direction}</span></td>'
+    '<td><span class="risk-badge {risk_class}">{squeeze_risk}</span></td>'
+    '<td style="font-size: 11px; color: #ccc;">{net_exposure}</td>'
+    '<td style="font-size: 11px; color: #ccc;">{volatility_impact}</td>'
+    '<td style="font-size: 11px; color: #888;">{pattern_type}</td>'
+    '<td style="color: {direction_color}; font-weight: 600;">{confidence}</td>'
+    '</tr>\n'
+)
+
+def _render_signal_items(signals, meta_html, show_walls=False):
+    """Render one options signal column as a single prebuilt HTML fragment"""
+    items = []
+    for signal in signals:
+        bias = signal["directional_bias"]
+        bias_html = _SIGNAL_BIAS_HTML.format(bias) if bias and bias != "Unknown" else ""
+        walls_html = ""
+        if show_walls and signal["put_wall_strikes"]:
+            strikes = ", ".join(f"${wall['strike_rounded']}" for wall in signal["put_wall_strikes"])
+            walls_html = _SIGNAL_WALLS_HTML.format(strikes)
+        items.append(_SIGNAL_ITEM_HTML.format(
+            ticker=signal["ticker"],
+            signal_strength=signal["signal_strength"],
+            meta=meta_html.format_map(signal),
+            bias=bias_html,
+            walls=walls_html
+        ))
+    return Markup("".join(items))
+
+# Row fragment for a ticker's multi-timeframe table; every value is escaped by Markup.format_map
+_MTF_ROW_HTML = Markup(
+    '<tr class="mtf-row dir-{direction_class}">'
+    '<td class="mtf-dte">{dte}D</td>'
+    '<td><span class="mtf-dir-badge">{direction}</span></td>'
+    '<td class="mtf-dir-value">{confidence}%</td>'
+    '<td class="mtf-dir-value">{success_probability}%</td>'
+    '<td class="mtf-pattern">{pattern_type}</td>'
+    '</tr>\n'
+)
+
+def _render_mtf_rows(timeframes):
+    """Render a ticker's multi-timeframe table body as a single prebuilt HTML fragment"""
+    return Markup("".join(_MTF_ROW_HTML.format_map(tf) for tf in timeframes))
+
+# Row fragment for the recommendations table; every value is escaped by Markup.format_map
+_RECOMMENDATION_ROW_HTML = Markup(
+    '<tr>'
+    '<td class="ticker-cell">{ticker}</td>'
+    '<td>{pattern}</td>'
+    '<td><span class="direction-badge {direction_class}">{direction}</span></td>'
+    '<td>{entry}</td>'
+    '<td>{target}</td>'
+    '<td>{expiry}</td>'
+    '<td class="probability-cell {prob_class}">{success_prob}</td>'
+    '<td>{risk_reward}</td>'
+    '</tr>\n'
+)
+
+def _render_recommendation_rows(recommendations):
+    """Render the recommendations table body as a single prebuilt HTML fragment"""
+    return Markup("".join(_RECOMMENDATION_ROW_HTML.format_map(rec) for rec in recommendations))
+
+# Above this many recommendations the table ships as JSON and dashboard.js builds the rows
+_CLIENT_RENDER_THRESHOLD = 500
+
+# Field order of each embedded recommendation row; renderRecommendations in dashboard.js reads the same order
+_RECOMMENDATION_FIELDS = (
+    "ticker", "pattern", "direction", "direction_class", "entry",
+    "target", "expiry", "success_prob", "prob_class", "risk_reward"
+)
+
+def _recommendations_json(recommendations):
+    """Recommendation rows as compact JSON that is safe to embed in a <script> element"""
+    rows = [[str(rec[field]) for field in _RECOMMENDATION_FIELDS] for rec in recommendations]
+    text = json.dumps(rows, separators=(",", ":"))
+    # Escaping these keeps the payload from closing the script element or reading as markup
+    return Markup(text.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026"))
+
+# Heavy strikes shown per side on a card; the analysis can return arbitrarily long lists
+_MAX_STRIKES_PER_SIDE = 5
+
+def _top_strikes(strikes):
+    """The heavy strikes with the most open interest, highest first, capped per card side"""
+    return heapq.nlargest(
+        _MAX_STRIKES_PER_SIDE, strikes,
+        key=lambda strike: safe_int(str(strike.get("oi") or 0).replace(",", ""))
+    )
+
+def _render_strike_clusters(strikes, side):
+    """Render heavy call or put strikes as a single prebuilt HTML fragment"""
+    strength_key = f"{side}_wall_strength"
+    blocks = []
+    for strike in strikes:
+        oi = strike.get("oi")
+        interpretation = strike.get("interpretation")
+        distance = strike.get("distance_from_price")
+        strength = strike.get(strength_key)
+        blocks.append(
+            f'<div class="strike-card strike-{side}">'
+            f'<div class="strike-head"><span class="strike-price">${escape(strike.get("strike", ""))}</span>'
+            + (f'<span class="strike-oi">{escape(number_format(oi))} OI</span>' if oi else '')
+            + '</div>'
+            + (f'<div class="strike-note">{escape(interpretation)}</div>' if interpretation else '')
+            + '<div class="strike-tags">'
+            + (f'<span class="strike-tag strike-distance">{escape(distance)}</span>' if distance else '')
+            + (f'<span class="strike-tag strike-wall">{escape(strength)} Wall</span>' if strength else '')
+            + '</div></div>\n'
+        )
+    return Markup("".join(blocks))
+
+# Fixed seven-row trade details block of a card timeframe; fields are pre-escaped Markup
+_TRADE_ROWS_HTML = Markup("".join(
+    f'<div class="trade-row"><span class="trade-label">{label}:</span><span class="trade-value">{value}</span></div>\n'
+    for label, value in (
+        ("Strategy", "{direction_title}"),
+        ("Entry", "{entry}"),
+        ("Target", "{target}"),
+        ("Stop Loss", "{stop_loss}"),
+        ("Risk/Reward", "{risk_reward}"),
+        ("Success Prob", "{success_prob}"),
+        ("Expiry", "{expiry} ({dte} DTE)")
+    )
+))
+
+# Connector drawn between consecutive points of a card's confidence timeline
+_TIMELINE_LINE_HTML = '<div class="timeline-line"></div>'
+
+# Timeframe tab of a consolidated card; ticker and confidence arrive escaped
+_CARD_TAB_HTML = (
+    '<div class="card-tab {active} {level}-confidence{conflict}" data-dte="{dte}" '
+    'onclick="event.stopPropagation(); switchConsolidatedTab(\'{ticker}\', \'{dte}\');">'
+    '<span class="dte-label">{dte}D</span>'
+    '<span class="confidence-mini">{confidence}</span>'
+    '{indicator}</div>\n'
+)
+
+def _render_card_tabs(ticker, tf_list):
+    """Render a card's timeframe tabs as a single prebuilt HTML fragment"""
+    ticker = escape(ticker)
+    return Markup("".join(
+        _CARD_TAB_HTML.format(
+            active="active" if i == 0 else "",
+            level=data["confidence_level"],
+            conflict=" conflicting" if data["conflicting"] else "",
+            dte=dte,
+            ticker=ticker,
+            confidence=data["confidence"],
+            indicator='<span class="conflict-indicator">⚠️</span>' if data["conflicting"] else ""
+        )
+        for i, (dte, data) in enumerate(tf_list)
+    ))
+
+def _render_items(items, item_html):
+    """Render a list of text items through a one-field HTML fragment, escaping each item"""
+    return Markup("".join(item_html.format(escape(item)) for item in items))
+
+# Item fragments for the list sections of a card timeframe panel
+_EVIDENCE_ITEM_HTML = '<li>{}</li>\n'
+_BLOCK_ITEM_HTML = '<div class="sm-item-amber"><div class="sm-note">{}</div></div>\n'
+_UNUSUAL_ITEM_HTML = '<div class="sm-item-red"><div class="sm-note">{}</div></div>\n'
+
+def _render_gamma_table(setups):
+    """Render the whole gamma squeeze table as a single prebuilt HTML fragment"""
+    return _GAMMA_TABLE_HEAD + Markup("").join(_GAMMA_ROW_HTML.format_map(setup) for setup in setups) + _GAMMA_TABLE_TAIL
+
+# Empty-state placeholders for the options signal columns, injected into the template
+# context as ready-made markup
+_EMPTY_STATE_DIV = '<div style="text-align: center; color: #666; font-size: 12px; padding: 20px;">{}</div>'
+_EMPTY_STATE_HTML = {
+    "empty_bullish_html": Markup(_EMPTY_STATE_DIV.format("No tickers meet bullish call criteria")),
+    "empty_bearish_html": Markup(_EMPTY_STATE_DIV.format("No tickers meet bearish put criteria")),
+    "empty_spreads_html": Markup(_EMPTY_STATE_DIV.format("No strong put walls detected")),
+    "empty_neutral_html": Markup(_EMPTY_STATE_DIV.format("All tickers have clear directional bias"))
+}
+
+# Header stat tiles; every value is escaped by Markup.format_map against the template context
+_HEADER_STATS_HTML = Markup("""                <div class="header-stat">
+                    <div class="stat-label">Patterns Found</div>
+                    <div class="stat-value">{patterns_found}</div>
+                </div>
+                <div class="header-stat">
+                    <div class="stat-label">Stocks Analyzed</div>
+                    <div class="stat-value">{stocks_analyzed}</div>
+                </div>
+                <div class="header-stat">
+                    <div class="stat-label">Success Rate</div>
+                    <div class="stat-value green">{avg_success_rate}</div>
+                </div>
+                <div class="header-stat">
+                    <div class="stat-label">Active Signals</div>
+                    <div class="stat-value yellow">{active_signals}</div>
+                </div>
+""")
+
+# Market pulse cards, filled from the dict built by _prepare_market_pulse
+_MARKET_PULSE_HTML = Markup("""                <div class="pulse-card">
+                    <div class="pulse-metric">Overall Sentiment</div>
+                    <div class="pulse-value positive">{overall_sentiment}</div>
+                    <div class="pulse-change positive">{sentiment_change}</div>
+                </div>
+                <div class="pulse-card">
+                    <div class="pulse-metric">Institutional Flow</div>
+                    <div class="pulse-value positive">{institutional_flow}</div>
+                    <div class="pulse-change positive">{flow_change}</div>
+                </div>
+                <div class="pulse-card">
+                    <div class="pulse-metric">VIX Level</div>
+                    <div class="pulse-value">{vix_level}</div>
+                    <div class="pulse-change">{vix_change}</div>
+                </div>
+                <div class="pulse-card">
+                    <div class="pulse-metric">Key Events</div>
+                    <div class="pulse-value">{key_events}</div>
+                </div>
+                <div class="pulse-card">
+                    <div class="pulse-metric">Gamma Exposure</div>
+                    <div class="pulse-value">{gamma_exposure}</div>
+                </div>
+""")
+
+def _confidence_level(confidence):
+    """Bucket an integer confidence into the high/medium/low styling tiers"""
+    return "high" if confidence >= 75 else "medium" if confidence >= 50 else "low"
+
+# Comments, and whitespace around CSS punctuation that never affects selectors
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s*([{};,])\s*|(:)\s+')
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(lambda m: m.group(1) or m.group(2), ' '.join(css.split()))
+    return css.replace(';}', '}').strip()
+
+# Output buffer for the rendered dashboard, large enough to hold a typical page
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Minimum number of ticker cards before they are built in a process pool
+_PARALLEL_CARD_THRESHOLD = 64
+
+# Static assets (stylesheet and script) copied next to generated dashboards
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# The multi-timeframe section lives in its own template that dashboard.html includes only
+# when there is multi-timeframe data, so basic runs never compile or walk that section
+_DASHBOARD_TEMPLATES = ("dashboard.html", "dashboard_multi_timeframe.html", "dashboard_card.html")
+
+# Compiled template bytecode is persisted across runs so a fresh process skips parsing and
+# compiling the dashboard; the directory is only created once a template is first loaded
+_BYTECODE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "oi_pattern_tracker", "jinja2")
+
+# Dashboard templates are compiled on first use and cached for the life of the process;
+# auto_reload is off so later renders skip the template file mtime check. .html templates
+# are autoescaped; prebuilt fragments are passed in as Markup so they are not escaped twice.
+# trim_blocks/lstrip_blocks drop the indentation and newlines around block tags at compile
+# time, so the heavily indented template emits far fewer whitespace-only chunks
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    bytecode_cache=None,
+    autoescape=select_autoescape(["html"]),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    optimized=True,
+    auto_reload=False,
+    cache_size=-1
+)
+_TEMPLATE_ENV.filters['number_format'] = number_format
+
+@lru_cache(maxsize=1)
+def _template_env():
+    """Return the shared template environment, attaching the on-disk bytecode cache on first use"""
+    # Without a writable cache directory templates compile in memory only
+    try:
+        os.makedirs(_BYTECODE_CACHE_DIR, exist_ok=True)
+        _TEMPLATE_ENV.bytecode_cache = FileSystemBytecodeCache(directory=_BYTECODE_CACHE_DIR, pattern="%s.cache")
+    except OSError:
+        pass
+    return _TEMPLATE_ENV
+
+@lru_cache(maxsize=None)
+def _card_template():
+    """Return the compiled per-ticker card template, loaded once per process"""
+    return _template_env().get_template("dashboard_card.html")
+
+# The card builders are module-level functions of their arguments only, so the process pool
+# pickles just the ticker and its trades for each task
+def _build_ticker_card(ticker, dated_trades):
+    """Build one consolidated trade card from a ticker's (dte, direction, trade) tuples sorted by DTE"""
+    timeframe_trades = [trade for _, _, trade in dated_trades]
+
+    # Calculate consensus
+    consensus = _calculate_consensus(timeframe_trades)
+
+    # Get current price from first trade
+    current_price = timeframe_trades[0].get("current_price", "N/A")
+
+    # Build consolidated trade object
+    consolidated_trade = {
+        "ticker": ticker,
+        "current_price": current_price,
+        "consensus_direction": consensus["direction"],
+        "consensus_direction_upper": consensus["direction"].upper(),
+        "consensus_confidence": consensus["confidence"],
+        "confluence_status": consensus["confluence_status"],
+        "confluence_label": _CONFLUENCE_STATUS_LABELS.get(consensus["confluence_status"], "⚡ PARTIAL"),
+        "timeframes": {},
+        "_conf_float": float(consensus["confidence"].rstrip("%"))
+    }
+
+    # Add each timeframe data
+    for dte, direction, trade in dated_trades:
+        # Read each field once into locals before building the entry
+        get = trade.get
+        thesis = get("smart_money_thesis") or get("institutional_flow") or "Smart money positioning detected"
+        evidence = get("supporting_evidence") or []
+        insights = get("smart_money_insights") or {}
+        oi_zones = insights.get("oi_concentration_zones") or {}
+        flow = insights.get("flow_analysis") or {}
+
+        # Display scalars are escaped here, once per card build, so the autoescaping card
+        # template passes them straight through
+        timeframe_data = {
+            "pattern_type": escape(_pretty_pattern(trade["pattern_type"])),
+            "direction": direction,
+            "direction_title": Markup(direction.title()),
+            "confidence": escape(trade["confidence"]),
+            "entry": escape(trade["entry"]),
+            "target": escape(trade["target"]),
+            "stop_loss": escape(trade["stop_loss"]),
+            "success_prob": escape(trade["success_probability"]),
+            "risk_reward": escape(trade["risk_reward"]),
+            "analysis": thesis,
+            "expiry": escape(get("expiry", "")),
+            "dte": dte,
+            "supporting_evidence": evidence[:3],  # Top 3 evidence points
+            "evidence_html": _render_items(evidence[:3], _EVIDENCE_ITEM_HTML),
+            "smart_money_insights": insights,
+            "large_blocks_html": _render_items(flow.get("large_blocks") or (), _BLOCK_ITEM_HTML),
+            "unusual_activity_html": _render_items(flow.get("unusual_activity") or (), _UNUSUAL_ITEM_HTML),
+            "heavy_call_strikes_html": _render_strike_clusters(_top_strikes(oi_zones.get("heavy_call_strikes") or ()), "call"),
+            "heavy_put_strikes_html": _render_strike_clusters(_top_strikes(oi_zones.get("heavy_put_strikes") or ()), "put"),
+            "confidence_level": _confidence_level(trade["_conf_int"]),
+            "conflicting": direction != consensus["direction"]
+        }
+        timeframe_data["trade_rows_html"] = _TRADE_ROWS_HTML.format_map(timeframe_data)
+        consolidated_trade["timeframes"][str(dte)] = timeframe_data
+
+    # (dte, data) pairs in DTE order for the template's tab and panel loops
+    tf_list = list(consolidated_trade["timeframes"].items())
+    consolidated_trade["tf_list"] = tf_list
+    consolidated_trade["tabs_html"] = _render_card_tabs(ticker, tf_list)
+
+    # The confidence timeline is fixed markup per card; joining the points with the connector
+    # line puts a line between each pair, replacing the template's loop.last check
+    consolidated_trade["timeline_points_html"] = Markup(_TIMELINE_LINE_HTML.join(
+        f'<div class="timeline-point {data["confidence_level"]}"></div>' for _, data in tf_list
+    ))
+    consolidated_trade["timeline_labels_html"] = Markup("".join(
+        f'<span class="timeline-label">{dte}D: {data["confidence"]}</span>' for dte, data in tf_list
+    ))
+
+    # The finished card markup is rendered here, in the worker process for large batches
+    consolidated_trade["card_html"] = Markup(_card_template().render(trade=consolidated_trade))
+
+    return consolidated_trade
+
+def _calculate_consensus(timeframe_trades):
+    """Calculate consensus direction and confluence status"""
+
+    # Most tickers only appear at one DTE - that trade is trivially its own consensus
+    if len(timeframe_trades) == 1:
+        trade = timeframe_trades[0]
+        try:
+            confidence = float(str(trade.get("confidence", "50")).replace("%", ""))
+        except ValueError:
+            confidence = 50.0
+        return {
+            "direction": _infer_direction(trade),
+            "confidence": f"{confidence:.0f}%",
+            "confluence_status": "aligned"
+        }
+
+    # Tally directions and confidences in a single pass
+    bullish_count = 0
+    bearish_count = 0
+    confidence_sum = 0.0
+
+    for trade in timeframe_trades:
+        if _infer_direction(trade) == "bullish":
+            bullish_count += 1
+        else:
+            bearish_count += 1
+
+        # Extract confidence
+        confidence_str = str(trade.get("confidence", "50")).replace("%", "")
+        try:
+            confidence_sum += float(confidence_str)
+        except ValueError:
+            confidence_sum += 50.0  # Default confidence
+
+    total_count = len(timeframe_trades)
+
+    # Determine consensus
+    if bullish_count == total_count:
+        consensus_direction = "bullish"
+        confluence_status = "aligned"
+    elif bearish_count == total_count:
+        consensus_direction = "bearish"
+        confluence_status = "aligned"
+    elif abs(bullish_count - bearish_count) <= 1:
+        consensus_direction = "mixed"
+        confluence_status = "divergent"
+    else:
+        consensus_direction = "bullish" if bullish_count > bearish_count else "bearish"
+        confluence_status = "partial"
+
+    # Calculate weighted average confidence
+    avg_confidence = confidence_sum / total_count if total_count else 50.0
+
+    return {
+        "direction": consensus_direction,
+        "confidence": f"{avg_confidence:.0f}%",
+        "confluence_status": confluence_status
+    }
+
+def _infer_direction(trade):
+    """Infer a trade's direction from its pattern type, falling back to the recommendation"""
+    # Method 1: Check pattern type for directional clues
+    pattern_type = trade.get("pattern_type", "").lower()
+    direction = next((d for sub, d in _PATTERN_DIR_RULES if sub in pattern_type), None)
+    if direction:
+        return direction
+
+    # Method 2: Use trade recommendation direction
+    rec_direction = trade.get("trade_recommendation", {}).get("direction", "").upper()
+    if "CALL" in rec_direction:
+        return "bullish"
+    if "PUT" in rec_direction:
+        return "bearish"
+
+    # Method 3: Default based on typical pattern
+    return "bullish"  # Default assumption
+
 class HTMLGenerator:
-    def __init__(self, template_dir="src/output/templates", output_dir="output"):
+    def __init__(self, template_dir="src/output/templates", output_dir="output", compress_output=True, max_workers=None):
         self.template_dir = template_dir
         self.output_dir = output_dir
+        self.compress_output = compress_output
+        # Worker processes for building large batches of ticker cards (None = one per core, 1 = serial)
+        self.max_workers = max_workers
         
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Create date-specific subdirectory
+        # Date-specific output directories under output_dir; makedirs creates the parents as needed
         today = datetime.now().strftime('%Y-%m-%d')
-        self.daily_output_dir = os.path.join("/Users/sayantbh/Workspace/fintool/open-interest-pattern-tracker/output", today)
-        os.makedirs(self.daily_output_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.daily_output_dir, "dashboards"), exist_ok=True)
-        os.makedirs(os.path.join(self.daily_output_dir, "reports"), exist_ok=True)
+        self.daily_output_dir = os.path.join(output_dir, today)
+        self.dashboards_dir = os.path.join(self.daily_output_dir, "dashboards")
+        self.reports_dir = os.path.join(self.daily_output_dir, "reports")
+        self.dashboard_path = os.path.join(self.dashboards_dir, "daily_overview.html")
+        os.makedirs(self.dashboards_dir, exist_ok=True)
+        os.makedirs(self.reports_dir, exist_ok=True)
+    
+    def generate_outputs(self, clusters, all_analyses, market_context=None):
+        """Generate the daily dashboard and the JSON reports side by side, returning (dashboard_path, reports)"""
+        # The two outputs share no files or instance state, so one thread's writes overlap the other's
+        # encoding; the card process pool spawns its workers, so it is safe to start from a thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            dashboard = executor.submit(self.generate_daily_dashboard, clusters, market_context)
+            reports = executor.submit(self.generate_json_reports, clusters, all_analyses)
+            return dashboard.result(), reports.result()
     
     def generate_daily_dashboard(self, clusters, market_context=None):
         """Generate the main daily dashboard HTML"""
         try:
             # Prepare template data
             template_data = self._prepare_dashboard_data(clusters, market_context)
+            dashboard_path = self.dashboard_path
+            dashboards_dir = self.dashboards_dir
             
-            # Load and render template
-            dashboard_html = self._render_dashboard_template(template_data)
+            # Stylesheet and script are shared by every dashboard, only copy them when missing or outdated
+            self._copy_static_asset("dashboard.css", dashboards_dir)
+            self._copy_static_asset("dashboard.js", dashboards_dir)
             
-            # Save dashboard file
-            dashboard_path = os.path.join(self.daily_output_dir, "dashboards", "daily_overview.html")
-            with open(dashboard_path, 'w', encoding='utf-8') as f:
-                f.write(dashboard_html)
+            # Skip rendering entirely when nothing has changed since the file on disk was written
+            key_path = os.path.join(dashboards_dir, ".cache", "daily_overview.key")
+            render_key = self._dashboard_render_key(template_data)
+            if self._is_render_current(dashboard_path, key_path, render_key):
+                print(f"Daily dashboard unchanged: {dashboard_path}")
+                return dashboard_path
+            if os.path.exists(key_path):
+                # Invalidate first so a failed render can never be mistaken for a current one
+                os.remove(key_path)
+            
+            # Render and save the dashboard chunk by chunk instead of building one large string
+            dashboard_stream = self._render_dashboard_template(template_data)
+            if self.compress_output:
+                # Tee each chunk into a precompressed copy so web servers can skip on-the-fly compression;
+                # chunks are encoded once and the same bytes go to both files
+                with open(dashboard_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f, \
+                        gzip.open(dashboard_path + ".gz", 'wb', compresslevel=5) as gz:
+                    for chunk in dashboard_stream:
+                        data = chunk.encode('utf-8')
+                        f.write(data)
+                        gz.write(data)
+            else:
+                # Binary mode skips the text layer's incremental encoder; the large buffer lets a typical
+                # page reach disk in a single write
+                with open(dashboard_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                    for chunk in dashboard_stream:
+                        f.write(chunk.encode('utf-8'))
+            self._write_render_key(key_path, render_key)
             
             print(f"Daily dashboard generated: {dashboard_path}")
             return dashboard_path
@@ -82,35 +749,76 @@ class HTMLGenerator:
             print(f"Dashboard generation failed: {str(e)}")
             return None
     
+    def _dashboard_render_key(self, template_data):
+        """Hash everything the rendered dashboard depends on, apart from the display timestamp"""
+        # last_update changes every minute; a refresh with identical data keeps the existing page
+        content = {k: v for k, v in template_data.items() if k != "last_update"}
+        template_mtimes = [os.path.getmtime(os.path.join(_TEMPLATE_DIR, name)) for name in _DASHBOARD_TEMPLATES]
+        return _content_hash([template_mtimes, self.compress_output, content])
+    
+    def _is_render_current(self, dashboard_path, key_path, render_key):
+        """Check whether the dashboard on disk was rendered from the same data"""
+        if not os.path.exists(dashboard_path) or not os.path.exists(key_path):
+            return False
+        if self.compress_output and not os.path.exists(dashboard_path + ".gz"):
+            return False
+        with open(key_path, 'r', encoding='utf-8') as f:
+            return f.read().strip() == render_key
+    
+    def _write_render_key(self, key_path, render_key):
+        """Record the key of the dashboard just written, replacing the old key atomically"""
+        os.makedirs(os.path.dirname(key_path), exist_ok=True)
+        tmp_path = key_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(render_key)
+        os.replace(tmp_path, key_path)
+    
+    def _copy_static_asset(self, filename, target_dir):
+        """Copy a static asset next to the generated output unless an up-to-date copy exists"""
+        source = os.path.join(_STATIC_DIR, filename)
+        target = os.path.join(target_dir, filename)
+        if not os.path.exists(target) or os.path.getmtime(source) > os.path.getmtime(target):
+            if filename.endswith(".css"):
+                # Stylesheets are minified on the way out so every dashboard download is smaller
+                with open(source, 'r', encoding='utf-8') as f:
+                    css = _minify_css(f.read())
+                with open(target, 'w', encoding='utf-8') as f:
+                    f.write(css)
+            else:
+                shutil.copyfile(source, target)
+    
     def generate_json_reports(self, clusters, all_analyses):
         """Generate JSON reports for API consumption"""
         try:
-            today = datetime.now().strftime('%Y-%m-%d')
+            dumps = _report_dumps()
+            normalized = self._normalize_clusters(clusters)
+            # One clock read so the date and timestamp always agree, even across midnight
+            now = datetime.now()
             
             # Market summary report
             market_summary = {
-                "date": today,
-                "timestamp": datetime.now().isoformat(),
+                "date": now.strftime('%Y-%m-%d'),
+                "timestamp": now.isoformat(),
                 "total_analyzed": clusters["total_analyzed"],
                 "clustering_summary": clusters["summary"],
-                "high_conviction_trades": self._get_high_conviction_for_json(clusters)
+                "high_conviction_trades": self._get_high_conviction_for_json(normalized)
             }
             
-            market_summary_path = os.path.join(self.daily_output_dir, "reports", "market_summary.json")
-            with open(market_summary_path, 'w') as f:
-                json.dump(market_summary, f, indent=2)
+            market_summary_path = os.path.join(self.reports_dir, "market_summary.json")
+            with open(market_summary_path, 'wb') as f:
+                f.write(dumps(market_summary))
             
             # Individual analyses report
-            individual_analyses_path = os.path.join(self.daily_output_dir, "reports", "individual_analyses.json")
-            with open(individual_analyses_path, 'w') as f:
-                json.dump(all_analyses, f, indent=2)
+            individual_analyses_path = os.path.join(self.reports_dir, "individual_analyses.json")
+            with open(individual_analyses_path, 'wb') as f:
+                f.write(dumps(all_analyses))
             
             # Clustering results
-            clustering_path = os.path.join(self.daily_output_dir, "reports", "clustering_results.json")
-            with open(clustering_path, 'w') as f:
-                json.dump(clusters, f, indent=2)
+            clustering_path = os.path.join(self.reports_dir, "clustering_results.json")
+            with open(clustering_path, 'wb') as f:
+                f.write(dumps(clusters))
             
-            print(f"JSON reports generated in: {self.daily_output_dir}/reports/")
+            print(f"JSON reports generated in: {self.reports_dir}")
             return {
                 "market_summary": market_summary_path,
                 "individual_analyses": individual_analyses_path,
@@ -123,6 +831,7 @@ class HTMLGenerator:
     
     def _prepare_dashboard_data(self, clusters, market_context):
         """Prepare data for dashboard template with multi-timeframe support"""
+        clusters = self._normalize_clusters(clusters)
         high_conviction_trades = self._get_high_conviction_trades(clusters, max_count=3)
         all_recommendations = self._get_all_recommendations(clusters)
         market_pulse = self._prepare_market_pulse(clusters, market_context)
@@ -134,6 +843,9 @@ class HTMLGenerator:
         timeframe_comparison = self._prepare_timeframe_comparison_table(clusters)
         confluence_summary = self._prepare_confluence_summary(clusters)
 
+        # Very large tables are handed to the browser as one JSON payload instead of rendered here
+        client_side_rows = len(all_recommendations) > _CLIENT_RENDER_THRESHOLD
+
         template_data = {
             # Header stats
             "patterns_found": len(clusters["bullish_group"]["pattern_types"]) + len(clusters["bearish_group"]["pattern_types"]),
@@ -157,6 +869,8 @@ class HTMLGenerator:
 
             # All recommendations for table
             "all_recommendations": all_recommendations,
+            "recommendations_rows_html": Markup() if client_side_rows else _render_recommendation_rows(all_recommendations),
+            "recommendations_json": _recommendations_json(all_recommendations) if client_side_rows else None,
 
             # Risk metrics (calculated from positions)
             "risk_metrics": self._calculate_risk_metrics(all_recommendations),
@@ -169,11 +883,35 @@ class HTMLGenerator:
             "multi_timeframe_trades": multi_timeframe_data,
             "timeframe_comparison": timeframe_comparison,
             "confluence_summary": confluence_summary,
-            "has_multi_timeframe": bool(clusters.get("multi_timeframe", {}).get("by_ticker"))
+            "has_multi_timeframe": bool(clusters.get("multi_timeframe", {}).get("by_ticker")),
+
+            # Static empty-state fragments
+            **_EMPTY_STATE_HTML
         }
 
+        # Flat scalar blocks are filled with one format_map each instead of a template lookup per field
+        template_data["header_stats_html"] = _HEADER_STATS_HTML.format_map(template_data)
+        template_data["market_pulse_html"] = _MARKET_PULSE_HTML.format_map(market_pulse)
+
         return template_data
 
+    def _normalize_clusters(self, clusters):
+        """Return a copy of clusters whose tickers carry their numeric fields pre-parsed"""
+        # Tickers are copied so the parsed fields never leak into clustering_results.json
+        normalized = dict(clusters)
+        for group in ("bullish_group", "bearish_group"):
+            if group not in clusters:
+                continue
+            tickers = []
+            for ticker in clusters[group]["tickers"]:
+                ticker = dict(ticker)
+                ticker["_dte_int"] = safe_int(ticker.get("dte", 30))
+                ticker["_conf_int"] = safe_int(ticker.get("confidence", 0))
+                ticker["_sp_int"] = safe_int(ticker.get("success_probability", 0))
+                tickers.append(ticker)
+            normalized[group] = dict(clusters[group], tickers=tickers)
+        return normalized
+
     def _prepare_multi_timeframe_data(self, clusters):
         """Prepare multi-timeframe trade data for dashboard"""
         multi_timeframe_section = clusters.get("multi_timeframe", {})
@@ -188,20 +926,19 @@ class HTMLGenerator:
             timeframe_entries = []
             for dte, analysis in timeframes.items():
                 direction_class = "bullish" if analysis.get("classification") == "bullish" else "bearish"
-                direction_color = "#00ff88" if direction_class == "bullish" else "#ff4444"
 
                 timeframe_entries.append({
                     "dte": dte,
+                    "_dte_int": int(dte),
                     "direction": analysis.get("direction", "NEUTRAL"),
                     "confidence": safe_int(analysis.get("confidence", 0)),
                     "success_probability": safe_int(analysis.get("success_probability", 0)),
                     "pattern_type": analysis.get("pattern_type", "unknown"),
-                    "direction_class": direction_class,
-                    "direction_color": direction_color
+                    "direction_class": direction_class
                 })
 
             # Sort timeframes by DTE
-            timeframe_entries.sort(key=lambda x: int(x["dte"]))
+            timeframe_entries.sort(key=itemgetter("_dte_int"))
 
             # Determine overall confluence
             confluence_type = confluence_data.get("confluence_type", "unknown")
@@ -211,17 +948,31 @@ class HTMLGenerator:
                 "unclear": "neutral"
             }.get(confluence_type, "neutral")
 
+            overall_direction = confluence_data.get("overall_direction", "mixed")
+            avg_confidence = confluence_data.get("avg_confidence", 0)
+            if confluence_type == "aligned":
+                confluence_blurb = f"All timeframes show consistent {overall_direction} positioning. High conviction institutional signal."
+            elif confluence_type == "divergent":
+                confluence_blurb = "Short-term vs long-term signals conflict. Suggests tactical trading vs strategic positioning by institutions."
+            else:
+                confluence_blurb = "Mixed or unclear signals across timeframes. Wait for directional clarity."
+
             multi_timeframe_trades.append({
                 "ticker": ticker,
                 "timeframes": timeframe_entries,
+                "timeframe_rows_html": _render_mtf_rows(timeframe_entries),
                 "confluence_type": confluence_type,
+                "confluence_type_upper": confluence_type.upper(),
                 "confluence_class": confluence_class,
-                "overall_direction": confluence_data.get("overall_direction", "mixed"),
-                "avg_confidence": confluence_data.get("avg_confidence", 0)
+                "overall_direction": overall_direction,
+                "avg_confidence": avg_confidence,
+                "avg_confidence_rounded": round(avg_confidence, 0),
+                "confluence_header": _CONFLUENCE_HEADERS.get(confluence_type, "❓ UNCLEAR DIRECTION"),
+                "confluence_blurb": confluence_blurb
             })
 
         # Sort by average confidence descending
-        multi_timeframe_trades.sort(key=lambda x: x["avg_confidence"], reverse=True)
+        multi_timeframe_trades.sort(key=itemgetter("avg_confidence"), reverse=True)
 
         return multi_timeframe_trades
 
@@ -243,6 +994,7 @@ class HTMLGenerator:
 
             comparison_data.append({
                 "dte": dte,
+                "_dte_int": int(dte),
                 "total_signals": stats.get("total_signals", 0),
                 "bullish_signals": stats.get("bullish_signals", 0),
                 "bearish_signals": stats.get("bearish_signals", 0),
@@ -253,7 +1005,7 @@ class HTMLGenerator:
             })
 
         # Sort by DTE
-        comparison_data.sort(key=lambda x: int(x["dte"]))
+        comparison_data.sort(key=itemgetter("_dte_int"))
 
         return comparison_data
 
@@ -275,6 +1027,10 @@ class HTMLGenerator:
     def _prepare_gamma_squeeze_data(self, clusters):
         """Prepare gamma squeeze analysis data for dashboard"""
         gamma_setups = []
+        high_risk_count = 0
+        upward_count = 0
+        flip_pct_sum = 0.0
+        risk_priority = {"High": 3, "Medium": 2, "Low": 1}
         
         # Process all tickers from both bullish and bearish clusters
         all_tickers = clusters["bullish_group"]["tickers"] + clusters["bearish_group"]["tickers"]
@@ -292,26 +1048,12 @@ class HTMLGenerator:
                 current_price = float(str(ticker.get("current_price", "0")).replace("$", "").replace(",", "")) if ticker.get("current_price") else 0
                 
                 # Determine squeeze direction based on current price vs flip point
-                if current_price > flip_point:
-                    squeeze_direction = "Upward"
-                    direction_class = "bullish"
-                    direction_color = "#00ff88"
-                else:
-                    squeeze_direction = "Downward"
-                    direction_class = "bearish"
-                    direction_color = "#ff4444"
+                squeeze_direction, direction_class, direction_color, direction_arrow = _SQUEEZE_STYLES[current_price > flip_point]
                 
                 # Calculate distance from flip point
                 flip_distance = abs(current_price - flip_point) if flip_point and current_price else 0
                 flip_distance_pct = (flip_distance / current_price * 100) if current_price > 0 else 0
                 
-                # Determine risk level styling
-                risk_color = {
-                    "High": "#ff4444",
-                    "Medium": "#ffaa00", 
-                    "Low": "#00ff88"
-                }.get(squeeze_risk, "#888888")
-                
                 gamma_setup = {
                     "ticker": ticker["ticker"],
                     "current_price": f"${current_price:.2f}" if current_price else ticker.get("current_price", "N/A"),
@@ -320,35 +1062,37 @@ class HTMLGenerator:
                     "squeeze_direction": squeeze_direction,
                     "direction_class": direction_class,
                     "direction_color": direction_color,
+                    "direction_arrow": direction_arrow,
                     "squeeze_risk": squeeze_risk,
-                    "risk_color": risk_color,
+                    "risk_class": squeeze_risk.lower(),
                     "net_exposure": net_exposure,
                     "volatility_impact": gamma_analysis.get("volatility_impact", "Unknown"),
-                    "pattern_type": ticker.get("pattern_type", "").replace("_", " ").title(),
-                    "confidence": f"{safe_int(ticker.get('confidence', 0))}%"
+                    "pattern_type": _pretty_pattern(ticker.get("pattern_type", "")),
+                    "confidence": f"{ticker['_conf_int']}%",
+                    "_sort_key": (risk_priority.get(squeeze_risk, 0), ticker["_conf_int"])
                 }
                 
                 gamma_setups.append(gamma_setup)
+                
+                # Accumulate summary statistics in the same pass
+                high_risk_count += squeeze_risk == "High"
+                upward_count += squeeze_direction == "Upward"
+                flip_pct_sum += flip_distance_pct
         
         # Sort by squeeze risk priority (High -> Medium -> Low) and then by confidence
-        risk_priority = {"High": 3, "Medium": 2, "Low": 1}
-        gamma_setups.sort(
-            key=lambda x: (risk_priority.get(x["squeeze_risk"], 0), safe_int(x["confidence"])),
-            reverse=True
-        )
+        gamma_setups.sort(key=itemgetter("_sort_key"), reverse=True)
         
-        # Calculate summary statistics
+        # Summary statistics (counters accumulated in the loop above)
         total_setups = len(gamma_setups)
-        high_risk_count = len([g for g in gamma_setups if g["squeeze_risk"] == "High"])
-        upward_count = len([g for g in gamma_setups if g["squeeze_direction"] == "Upward"])
         
         return {
             "gamma_setups": gamma_setups,
+            "gamma_table_html": _render_gamma_table(gamma_setups),
             "total_setups": total_setups,
             "high_risk_count": high_risk_count,
             "upward_squeeze_count": upward_count,
             "downward_squeeze_count": total_setups - upward_count,
-            "avg_flip_distance": f"{sum(float(g['flip_distance'].replace('%', '')) for g in gamma_setups) / total_setups:.1f}%" if total_setups > 0 else "0%"
+            "avg_flip_distance": f"{flip_pct_sum / total_setups:.1f}%" if total_setups > 0 else "0%"
         }
     
     def _prepare_options_signals(self, clusters):
@@ -364,7 +1108,30 @@ class HTMLGenerator:
         for ticker in all_tickers:
             ticker_symbol = ticker["ticker"]
             smart_money = ticker.get("smart_money_insights", {})
-            
+
+            # No smart money data means no signals can fire - record as neutral and skip the scoring
+            if not smart_money:
+                neutral_tickers.append({
+                    "ticker": ticker_symbol,
+                    "pc_ratio": "1.00",
+                    "confidence": ticker.get("confidence", "N/A"),
+                    "pattern": _pretty_pattern(ticker.get("pattern_type", "")),
+                    "current_price": ticker.get("current_price", "N/A"),
+                    "signals_count": 0,
+                    "signal_strength": "Weak",
+                    "directional_bias": "Unknown",
+                    "signal_classification": "",
+                    "put_spread_signals": 0,
+                    "max_pain_level": "N/A",
+                    "put_wall_strikes": [],
+                    "safety_margin": "N/A",
+                    "pin_risk": "Unknown",
+                    "pcs_suitability": "Unknown",
+                    "pcs_thesis": "",
+                    "_sort_key": (_STRENGTH_SCORE["Weak"], ticker["_conf_int"])
+                })
+                continue
+
             # Extract put/call ratio
             pc_dynamics = smart_money.get("put_call_dynamics", {})
             pc_ratio = float(pc_dynamics.get("ratio", 1.0)) if pc_dynamics.get("ratio") else 1.0
@@ -461,6 +1228,7 @@ class HTMLGenerator:
                             if safety_margin > 5:  # At least 5% safety margin
                                 put_wall_strikes.append({
                                     "strike": strike_price,
+                                    "strike_rounded": round(strike_price, 0),
                                     "oi": put_strike.get("oi", 0),
                                     "safety_margin": safety_margin
                                 })
@@ -468,14 +1236,16 @@ class HTMLGenerator:
                         continue
             
             # Categorize ticker based on signals
+            signals_count = max(bullish_signals, bearish_signals, put_spread_signals)
+            signal_strength = "Strong" if signals_count >= 3 else "Moderate" if signals_count >= 2 else "Weak"
             signal_data = {
                 "ticker": ticker_symbol,
                 "pc_ratio": f"{pc_ratio:.2f}",
                 "confidence": ticker.get("confidence", "N/A"),
-                "pattern": ticker.get("pattern_type", "").replace("_", " ").title(),
+                "pattern": _pretty_pattern(ticker.get("pattern_type", "")),
                 "current_price": ticker.get("current_price", "N/A"),
-                "signals_count": max(bullish_signals, bearish_signals, put_spread_signals),
-                "signal_strength": "Strong" if max(bullish_signals, bearish_signals, put_spread_signals) >= 3 else "Moderate" if max(bullish_signals, bearish_signals, put_spread_signals) >= 2 else "Weak",
+                "signals_count": signals_count,
+                "signal_strength": signal_strength,
                 "directional_bias": directional_bias.replace("_", " ").title() if directional_bias else "Unknown",
                 "signal_classification": pc_dynamics.get("signal_classification", "").replace("_", " ") if pc_dynamics.get("signal_classification") else "",
                 "put_spread_signals": put_spread_signals,
@@ -484,7 +1254,8 @@ class HTMLGenerator:
                 "safety_margin": f"{max(s['safety_margin'] for s in put_wall_strikes):.1f}%" if put_wall_strikes else "N/A",
                 "pin_risk": pin_risk.title() if pin_risk else "Unknown",
                 "pcs_suitability": pcs_suitability.title() if pcs_suitability else "Unknown",
-                "pcs_thesis": pcs_analysis.get("credit_spread_thesis", "")[:50] + "..." if pcs_analysis.get("credit_spread_thesis") else ""
+                "pcs_thesis": pcs_analysis.get("credit_spread_thesis", "")[:50] + "..." if pcs_analysis.get("credit_spread_thesis") else "",
+                "_sort_key": (_STRENGTH_SCORE[signal_strength], ticker["_conf_int"])
             }
             
             # Prioritize put credit spreads if strong signals present
@@ -497,12 +1268,8 @@ class HTMLGenerator:
             else:
                 neutral_tickers.append(signal_data)
         
-        # Sort by signal strength and confidence
-        def sort_key(x):
-            confidence = safe_int(str(x["confidence"]).replace("%", ""))
-            strength_score = {"Strong": 3, "Moderate": 2, "Weak": 1}.get(x["signal_strength"], 0)
-            return (strength_score, confidence)
-        
+        # Sort by signal strength and confidence (key precomputed on each entry)
+        sort_key = itemgetter("_sort_key")
         bullish_calls.sort(key=sort_key, reverse=True)
         bearish_puts.sort(key=sort_key, reverse=True)
         put_credit_spreads.sort(key=sort_key, reverse=True)
@@ -513,6 +1280,10 @@ class HTMLGenerator:
             "bearish_puts": bearish_puts,
             "put_credit_spreads": put_credit_spreads,
             "neutral_tickers": neutral_tickers,
+            "bullish_calls_html": _render_signal_items(bullish_calls, _SIGNAL_META_HTML),
+            "bearish_puts_html": _render_signal_items(bearish_puts, _SIGNAL_META_HTML),
+            "put_credit_spreads_html": _render_signal_items(put_credit_spreads, _SPREAD_META_HTML, show_walls=True),
+            "neutral_tickers_html": _render_signal_items(neutral_tickers, _SIGNAL_META_HTML),
             "total_bullish": len(bullish_calls),
             "total_bearish": len(bearish_puts),
             "total_put_spreads": len(put_credit_spreads),
@@ -565,270 +1336,105 @@ class HTMLGenerator:
     def _get_high_conviction_trades(self, clusters, max_count=10):
         """Get ALL trades for featured cards"""
         # Get ALL trades from each cluster
-        bullish_trades = sorted(
-            clusters["bullish_group"]["tickers"],
-            key=lambda x: safe_int(x["confidence"]) * safe_int(x["success_probability"]),
-            reverse=True
-        )
-        
-        bearish_trades = sorted(
-            clusters["bearish_group"]["tickers"],
-            key=lambda x: safe_int(x["confidence"]) * safe_int(x["success_probability"]),
-            reverse=True
-        )
-        
-        high_conviction = []
-        
-        # Add bullish trades
-        for trade in bullish_trades:
-            high_conviction.append({
-                "ticker": trade["ticker"],
-                "pattern_type": trade["pattern_type"].replace("_", " ").title(),
-                "direction": "bullish",
-                "confidence": f"{safe_int(trade['confidence'])}%",
-                "entry": f"${safe_float(trade['entry'])}" if str(trade['entry']).replace('.','').replace('-','').isdigit() or '.' in str(trade['entry']) else trade["entry"],
-                "target": f"${safe_float(trade['target'])}" if str(trade['target']).replace('.','').replace('-','').isdigit() or '.' in str(trade['target']) else trade["target"],
-                "stop_loss": f"${safe_float(trade['stop_loss'])}" if str(trade['stop_loss']).replace('.','').replace('-','').isdigit() or '.' in str(trade['stop_loss']) else trade["stop_loss"],
-                "risk_reward": trade["risk_reward"],
-                "expiry": trade["expiry"],
-                "dte": trade["dte"],
-                "success_prob": f"{safe_int(trade['success_probability'])}%",
-                "current_price": trade["current_price"],
-                "supporting_evidence": trade["supporting_evidence"][:4],  # Top 4 evidence points
-                "timeframe_confluence": trade.get("timeframe_confluence", "Multi-timeframe aligned"),
-                "entry_triggers": trade.get("entry_triggers", ["Price confirmation", "Volume spike"]),
-                "technical_levels": trade.get("technical_levels", {}),
-                "volatility_regime": trade.get("volatility_regime", "Medium volatility"),
-                "institutional_flow": trade.get("institutional_flow", "Smart money positioning"),
-                "smart_money_thesis": trade.get("smart_money_thesis", "Institutional positioning detected"),
-                "smart_money_insights": trade.get("smart_money_insights", {})
-            })
-        
-        # Add bearish trades
-        for trade in bearish_trades:
-            high_conviction.append({
-                "ticker": trade["ticker"],
-                "pattern_type": trade["pattern_type"].replace("_", " ").title(),
-                "direction": "bearish",
-                "confidence": f"{safe_int(trade['confidence'])}%",
-                "entry": f"${safe_float(trade['entry'])}" if str(trade['entry']).replace('.','').replace('-','').isdigit() or '.' in str(trade['entry']) else trade["entry"],
-                "target": f"${safe_float(trade['target'])}" if str(trade['target']).replace('.','').replace('-','').isdigit() or '.' in str(trade['target']) else trade["target"],
-                "stop_loss": f"${safe_float(trade['stop_loss'])}" if str(trade['stop_loss']).replace('.','').replace('-','').isdigit() or '.' in str(trade['stop_loss']) else trade["stop_loss"],
-                "risk_reward": trade["risk_reward"],
-                "expiry": trade["expiry"],
-                "dte": trade["dte"],
-                "success_prob": f"{safe_int(trade['success_probability'])}%",
-                "current_price": trade["current_price"],
-                "supporting_evidence": trade["supporting_evidence"][:4],
-                "timeframe_confluence": trade.get("timeframe_confluence", "Multi-timeframe aligned"),
-                "entry_triggers": trade.get("entry_triggers", ["Price confirmation", "Volume spike"]),
-                "technical_levels": trade.get("technical_levels", {}),
-                "volatility_regime": trade.get("volatility_regime", "Medium volatility"),
-                "institutional_flow": trade.get("institutional_flow", "Smart money positioning"),
-                "smart_money_thesis": trade.get("smart_money_thesis", "Institutional positioning detected"),
-                "smart_money_insights": trade.get("smart_money_insights", {})
-            })
+        bullish_trades = self._sort_by_conviction(clusters["bullish_group"]["tickers"])
+        bearish_trades = self._sort_by_conviction(clusters["bearish_group"]["tickers"])
         
-
+        high_conviction = [_featured_trade(t, "bullish") for t in bullish_trades]
+        high_conviction.extend(_featured_trade(t, "bearish") for t in bearish_trades)
         
         return high_conviction  # Return ALL trades, not limited
 
+    def _sort_by_conviction(self, tickers):
+        """Sort tickers by confidence x success probability, highest first"""
+        # Tickers arrive pre-parsed from _normalize_clusters; the shared argsort helper does the ordering
+        keys = [t["_conf_int"] * t["_sp_int"] for t in tickers]
+        return [tickers[i] for i in _order_desc(keys)]
+
     def _get_consolidated_high_conviction_trades(self, clusters, max_count=None):
         """Consolidate trades by ticker with multi-timeframe data"""
 
-        # Collect all trades across timeframes
-        all_trades = []
-        for group in ["bullish_group", "bearish_group"]:
-            if group in clusters:
-                all_trades.extend(clusters[group]["tickers"])
+        # Collect all trades across timeframes, labelled with the direction of their cluster
+        all_trades = chain.from_iterable(
+            ((direction, trade) for trade in clusters.get(group, {}).get("tickers", ()))
+            for group, direction in (("bullish_group", "bullish"), ("bearish_group", "bearish"))
+        )
 
         # Group by ticker
-        ticker_groups = {}
-        for trade in all_trades:
-            ticker = trade["ticker"]
-            if ticker not in ticker_groups:
-                ticker_groups[ticker] = []
-            ticker_groups[ticker].append(trade)
-
-        consolidated_trades = []
-        for ticker, timeframe_trades in ticker_groups.items():
-            # Sort by DTE
-            timeframe_trades.sort(key=lambda x: safe_int(x.get("dte", 30)))
-
-            # Calculate consensus
-            consensus = self._calculate_consensus(timeframe_trades)
-
-            # Get current price from first trade
-            current_price = timeframe_trades[0].get("current_price", "N/A")
-
-            # Build consolidated trade object
-            consolidated_trade = {
-                "ticker": ticker,
-                "current_price": current_price,
-                "consensus_direction": consensus["direction"],
-                "consensus_confidence": consensus["confidence"],
-                "confluence_status": consensus["confluence_status"],
-                "timeframes": {}
-            }
+        ticker_groups = defaultdict(list)
+        for direction, trade in all_trades:
+            ticker_groups[trade["ticker"]].append((direction, trade))
 
-            # Add each timeframe data
-            for trade in timeframe_trades:
-                dte = safe_int(trade.get("dte", 30))
-
-                # Determine direction from trade classification
-                direction = "bullish" if "bullish_group" in str(trade) else trade.get("direction", "bullish")
-
-                consolidated_trade["timeframes"][str(dte)] = {
-                    "pattern_type": trade["pattern_type"].replace("_", " ").title(),
-                    "direction": direction,
-                    "confidence": trade["confidence"],
-                    "entry": trade["entry"],
-                    "target": trade["target"],
-                    "stop_loss": trade["stop_loss"],
-                    "success_prob": trade["success_probability"],
-                    "risk_reward": trade["risk_reward"],
-                    "analysis": trade.get("smart_money_thesis", trade.get("institutional_flow", "Smart money positioning detected")),
-                    "expiry": trade.get("expiry", ""),
-                    "dte": dte,
-                    "supporting_evidence": trade.get("supporting_evidence", [])[:3],  # Top 3 evidence points
-                    "smart_money_insights": trade.get("smart_money_insights", {})
-                }
+        # Each ticker's trades sorted by the DTE parsed in _normalize_clusters
+        tickers = list(ticker_groups)
+        trades = [
+            sorted(((trade["_dte_int"], direction, trade) for direction, trade in labelled_trades), key=itemgetter(0))
+            for labelled_trades in ticker_groups.values()
+        ]
 
-            consolidated_trades.append(consolidated_trade)
+        # Large batches are built across processes
+        consolidated_trades = self._build_ticker_cards(tickers, trades)
 
-        # Sort by consensus confidence
-        try:
-            consolidated_trades.sort(
-                key=lambda x: float(x["consensus_confidence"].replace("%", "")),
-                reverse=True
-            )
-        except (ValueError, KeyError):
-            # Fallback sorting if confidence parsing fails
-            consolidated_trades.sort(key=lambda x: len(x["timeframes"]), reverse=True)
+        # Sort by consensus confidence (always a formatted number from _calculate_consensus)
+        consolidated_trades.sort(key=itemgetter("_conf_float"), reverse=True)
 
         return consolidated_trades if max_count is None else consolidated_trades[:max_count]
 
-    def _calculate_consensus(self, timeframe_trades):
-        """Calculate consensus direction and confluence status"""
-
-        # Extract directions and confidences
-        directions = []
-        confidences = []
-
-        for trade in timeframe_trades:
-            # Try to extract direction from various sources
-            direction = "unknown"
-
-            # Method 1: Check pattern type for directional clues
-            pattern_type = trade.get("pattern_type", "").lower()
-            if "accumulation" in pattern_type or "squeeze" in pattern_type:
-                direction = "bullish"
-            elif "distribution" in pattern_type or "hedging" in pattern_type:
-                direction = "bearish"
-            else:
-                # Method 2: Use trade recommendation direction
-                trade_rec = trade.get("trade_recommendation", {})
-                rec_direction = trade_rec.get("direction", "").upper()
-                if "CALL" in rec_direction:
-                    direction = "bullish"
-                elif "PUT" in rec_direction:
-                    direction = "bearish"
-                else:
-                    # Method 3: Default based on typical pattern
-                    direction = "bullish"  # Default assumption
-
-            directions.append(direction)
-
-            # Extract confidence
-            confidence_str = str(trade.get("confidence", "50")).replace("%", "")
+    def _build_ticker_cards(self, tickers, trades):
+        """Build one card per ticker from its DTE-sorted (dte, direction, trade) tuples, in order"""
+        # Cards are independent, but process start-up and pickling only pay off for big batches
+        if len(tickers) >= _PARALLEL_CARD_THRESHOLD and self.max_workers != 1:
             try:
-                confidence = float(confidence_str)
-            except ValueError:
-                confidence = 50.0  # Default confidence
-
-            confidences.append(confidence)
-
-        # Count directions
-        bullish_count = directions.count("bullish")
-        bearish_count = directions.count("bearish")
-        total_count = len(directions)
-
-        # Determine consensus
-        if bullish_count == total_count:
-            consensus_direction = "bullish"
-            confluence_status = "aligned"
-        elif bearish_count == total_count:
-            consensus_direction = "bearish"
-            confluence_status = "aligned"
-        elif abs(bullish_count - bearish_count) <= 1:
-            consensus_direction = "mixed"
-            confluence_status = "divergent"
-        else:
-            consensus_direction = "bullish" if bullish_count > bearish_count else "bearish"
-            confluence_status = "partial"
-
-        # Calculate weighted average confidence
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 50.0
+                # Workers are spawned rather than forked, since generate_outputs builds the cards
+                # from a worker thread and forking a multithreaded process can deadlock the child
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    return list(executor.map(_build_ticker_card, tickers, trades, chunksize=8))
+            except Exception as e:
+                print(f"Parallel card build failed, falling back to serial: {str(e)}")
+        return list(map(_build_ticker_card, tickers, trades))
 
-        return {
-            "direction": consensus_direction,
-            "confidence": f"{avg_confidence:.0f}%",
-            "confluence_status": confluence_status
-        }
-    
     def _get_all_recommendations(self, clusters):
         """Get all recommendations for the main table"""
-        recommendations = []
-        
-        # Add bullish recommendations
-        for trade in clusters["bullish_group"]["tickers"]:
-            recommendations.append({
-                "ticker": trade["ticker"],
-                "pattern": trade["pattern_type"].replace("_", " ").title(),
-                "direction": "CALL",
-                "entry": trade["entry"],
-                "target": trade["target"],
-                "expiry": f"{trade['expiry']} ({trade['dte']} DTE)",
-                "success_prob": f"{safe_int(trade['success_probability'])}%",
-                "risk_reward": trade["risk_reward"]
-            })
+        # Bullish trades first, then bearish, so equal probabilities keep that order after sorting
+        rows = [
+            (trade, direction, direction_class, prob_class)
+            for direction, direction_class, prob_class, group in (
+                ("CALL", "call", "positive", "bullish_group"),
+                ("PUT", "put", "negative", "bearish_group")
+            )
+            for trade in clusters[group]["tickers"]
+        ]
         
-        # Add bearish recommendations
-        for trade in clusters["bearish_group"]["tickers"]:
-            recommendations.append({
+        # Order by the success probability parsed in _normalize_clusters, then build dicts in final order
+        order = _order_desc([row[0]["_sp_int"] for row in rows])
+        return [
+            {
                 "ticker": trade["ticker"],
-                "pattern": trade["pattern_type"].replace("_", " ").title(),
-                "direction": "PUT",
+                "pattern": _pretty_pattern(trade["pattern_type"]),
+                "direction": direction,
+                "direction_class": direction_class,
                 "entry": trade["entry"],
                 "target": trade["target"],
                 "expiry": f"{trade['expiry']} ({trade['dte']} DTE)",
-                "success_prob": f"{safe_int(trade['success_probability'])}%",
+                "success_prob": f"{trade['_sp_int']}%",
+                "prob_class": prob_class,
                 "risk_reward": trade["risk_reward"]
-            })
-        
-        # Sort by success probability using safe_int
-        recommendations.sort(key=lambda x: safe_int(x["success_prob"]), reverse=True)
-        
-        return recommendations
+            }
+            for trade, direction, direction_class, prob_class in map(rows.__getitem__, order)
+        ]
     
     def _calculate_overall_success_rate(self, clusters):
         """Calculate weighted average success rate"""
-        total_weighted = 0
-        total_count = 0
-        
-        for ticker in clusters["bullish_group"]["tickers"]:
-            total_weighted += safe_int(ticker["success_probability"])
-            total_count += 1
+        probs = [
+            ticker["_sp_int"]
+            for ticker in chain(clusters["bullish_group"]["tickers"], clusters["bearish_group"]["tickers"])
+        ]
         
-        for ticker in clusters["bearish_group"]["tickers"]:
-            total_weighted += safe_int(ticker["success_probability"])
-            total_count += 1
-        
-        if total_count == 0:
+        if not probs:
             return "0.0%"
         
-        avg_success = total_weighted / total_count
-        return f"{avg_success:.1f}%"
+        return f"{_mean(probs):.1f}%"
     
     def _calculate_risk_metrics(self, recommendations):
         """Calculate portfolio-level risk metrics"""
@@ -853,1185 +1459,15 @@ class HTMLGenerator:
         return self._get_high_conviction_trades(clusters, max_count=5)
     
     def _render_dashboard_template(self, template_data):
-        """Render the dashboard using template based on our mockup"""
-        template_str = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>OI Pattern Tracker - Daily Analysis</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a0a; color: #e0e0e0; line-height: 1.5; }
-        .container { max-width: 1400px; margin: 0 auto; padding: 20px; }
-        .header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 30px; padding-bottom: 20px; border-bottom: 1px solid #333; }
-        .logo { font-size: 28px; font-weight: 700; color: #fff; }
-        .header-stats { display: flex; gap: 40px; }
-        .header-stat { text-align: center; }
-        .stat-label { font-size: 11px; color: #888; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 4px; }
-        .stat-value { font-size: 20px; font-weight: 700; color: #fff; }
-        .stat-value.green { color: #00ff88; }
-        .stat-value.red { color: #ff4444; }
-        .stat-value.yellow { color: #ffaa00; }
-        .market-pulse { background: #111; border: 1px solid #333; border-radius: 12px; padding: 25px; margin-bottom: 25px; }
-        .section-title { font-size: 20px; font-weight: 600; color: #fff; margin-bottom: 20px; display: flex; align-items: center; }
-        .pulse-icon { width: 8px; height: 8px; background: #00ff88; border-radius: 50%; margin-right: 10px; animation: pulse 2s infinite; }
-        @keyframes pulse { 0% { opacity: 1; } 50% { opacity: 0.5; } 100% { opacity: 1; } }
-        .pulse-grid { display: grid; grid-template-columns: repeat(5, 1fr); gap: 20px; }
-        .pulse-card { background: #1a1a1a; padding: 20px; border-radius: 8px; border: 1px solid #333; }
-        .pulse-metric { font-size: 11px; color: #888; text-transform: uppercase; margin-bottom: 8px; }
-        .pulse-value { font-size: 18px; font-weight: 600; }
-        .pulse-change { font-size: 12px; margin-top: 4px; }
-        .positive { color: #00ff88; }
-        .negative { color: #ff4444; }
-        .conviction-section { background: #111; border: 1px solid #333; border-radius: 12px; padding: 25px; margin-bottom: 25px; }
-        .trade-cards { display: grid; grid-template-columns: repeat(auto-fit, minmax(500px, 1fr)); gap: 25px; }
-        .trade-card { background: #111; border: 2px solid #333; border-radius: 12px; overflow: hidden; position: relative; transition: all 0.3s ease; }
-        .trade-card:hover { transform: translateY(-2px); box-shadow: 0 8px 25px rgba(0, 0, 0, 0.3); }
-        .trade-card.consensus-bullish { border-left: 4px solid #00ff88; }
-        .trade-card.consensus-bearish { border-left: 4px solid #ff4444; }
-        .trade-card.consensus-mixed { border-left: 4px solid #ffaa00; }
-        .click-hint { position: absolute; bottom: 10px; right: 15px; color: #666; font-size: 11px; opacity: 0; transition: opacity 0.3s ease; }
-        .trade-card:hover .click-hint { opacity: 1; }
-
-        /* Enhanced Card Header */
-        .card-header { background: linear-gradient(135deg, #1a1a1a 0%, #151515 100%); padding: 20px; border-bottom: 1px solid #333; }
-        .ticker-main-info { display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 15px; }
-        .ticker-symbol { font-size: 24px; font-weight: 700; color: #fff; }
-        .current-price { font-size: 16px; color: #888; margin-top: 2px; }
-        .consensus-indicator { text-align: right; }
-        .confluence-status { display: block; font-size: 10px; font-weight: 600; text-transform: uppercase; margin-bottom: 4px; }
-        .confluence-status.aligned { color: #00ff88; }
-        .confluence-status.divergent { color: #ff4444; }
-        .confluence-status.partial { color: #ffaa00; }
-        .dominant-direction { font-size: 12px; font-weight: 600; text-transform: uppercase; }
-        .dominant-direction.bullish { color: #00ff88; }
-        .dominant-direction.bearish { color: #ff4444; }
-        .dominant-direction.mixed { color: #ffaa00; }
-
-        /* Enhanced Timeframe Tabs */
-        .card-timeframe-tabs { display: flex; background: #0a0a0a; border-radius: 8px; overflow: hidden; border: 1px solid #333; }
-        .card-tab { flex: 1; padding: 10px 8px; text-align: center; cursor: pointer; transition: all 0.3s ease; position: relative; border-right: 1px solid #333; }
-        .card-tab:last-child { border-right: none; }
-        .card-tab.active { background: #00ff88; color: #000; }
-        .card-tab:not(.active) { color: #888; background: #0a0a0a; }
-        .card-tab:not(.active):hover { background: #222; color: #fff; }
-        .card-tab.high-confidence:not(.active) { border-bottom: 2px solid #00ff88; }
-        .card-tab.medium-confidence:not(.active) { border-bottom: 2px solid #ffaa00; }
-        .card-tab.low-confidence:not(.active) { border-bottom: 2px solid #ff4444; }
-        .card-tab.conflicting { position: relative; }
-        .conflict-indicator { position: absolute; top: 2px; right: 2px; font-size: 8px; opacity: 0.8; }
-        .dte-label { display: block; font-size: 11px; font-weight: 600; }
-        .confidence-mini { display: block; font-size: 9px; opacity: 0.8; font-weight: 500; }
-
-        /* Timeframe Content */
-        .timeframe-content { padding: 20px; }
-        .timeframe-panel { display: none; }
-        .timeframe-panel.active { display: block; }
-        .timeframe-analysis { font-size: 12px; color: #ccc; line-height: 1.4; margin-top: 10px; }
-
-        /* Confidence Evolution */
-        .confidence-evolution { padding: 15px 20px; border-top: 1px solid #333; background: #0a0a0a; }
-        .evolution-label { font-size: 11px; color: #888; margin-bottom: 8px; text-transform: uppercase; }
-        .confidence-timeline { display: flex; align-items: center; gap: 10px; margin-bottom: 8px; }
-        .timeline-point { width: 8px; height: 8px; border-radius: 50%; }
-        .timeline-point.high { background: #00ff88; }
-        .timeline-point.medium { background: #ffaa00; }
-        .timeline-point.low { background: #ff4444; }
-        .timeline-line { flex: 1; height: 2px; background: #333; }
-        .timeline-labels { display: flex; justify-content: space-between; }
-        .timeline-label { font-size: 10px; color: #888; }
-
-        .trade-header { display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 15px; }
-        .ticker { font-size: 24px; font-weight: 700; color: #fff; }
-        .confidence-badge { background: #00ff88; color: #000; padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 600; }
-        .confidence-badge.bearish { background: #ff4444; color: #fff; }
-
-        .pattern-type { color: #00ff88; font-size: 14px; font-weight: 500; margin-bottom: 15px; text-transform: uppercase; }
-        .pattern-type.bearish { color: #ff4444; }
-
-        .trade-details { background: #0a0a0a; padding: 15px; border-radius: 8px; margin-bottom: 15px; }
-        .trade-row { display: flex; justify-content: space-between; margin-bottom: 8px; }
-        .trade-label { color: #888; font-size: 13px; }
-        .trade-value { color: #fff; font-weight: 500; font-size: 13px; }
-        .evidence-list { list-style: none; margin-top: 15px; }
-        .evidence-list li { font-size: 12px; color: #ccc; padding: 4px 0; padding-left: 15px; position: relative; }
-        .evidence-list li:before { content: "•"; color: #00ff88; position: absolute; left: 0; }
-        .recommendations-section { background: #111; border: 1px solid #333; border-radius: 12px; padding: 25px; margin-bottom: 25px; }
-        .recommendations-table { width: 100%; border-collapse: collapse; background: #1a1a1a; border-radius: 8px; overflow: hidden; }
-        .recommendations-table th { background: #0a0a0a; padding: 15px 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333; }
-        .recommendations-table td { padding: 15px 12px; border-bottom: 1px solid #222; font-size: 14px; }
-        .recommendations-table tr:hover { background: #222; }
-        .ticker-cell { font-weight: 700; font-size: 16px; color: #fff; }
-        .direction-badge { display: inline-block; padding: 4px 12px; border-radius: 4px; font-size: 11px; font-weight: 600; text-transform: uppercase; }
-        .direction-badge.call { background: #00ff88; color: #000; }
-        .direction-badge.put { background: #ff4444; color: #fff; }
-        .probability-cell { font-weight: 700; font-size: 16px; }
-        .risk-section { background: #111; border: 1px solid #333; border-radius: 12px; padding: 25px; margin-bottom: 25px; }
-        .risk-grid { display: grid; grid-template-columns: repeat(4, 1fr); gap: 20px; }
-        .risk-card { background: #1a1a1a; padding: 20px; border-radius: 8px; text-align: center; border: 1px solid #333; }
-        .risk-metric { font-size: 11px; color: #888; text-transform: uppercase; margin-bottom: 10px; }
-        .risk-value { font-size: 22px; font-weight: 700; }
-        .gamma-section { background: #111; border: 1px solid #333; border-radius: 12px; padding: 25px; margin-bottom: 25px; }
-        .gamma-summary { display: grid; grid-template-columns: repeat(4, 1fr); gap: 20px; margin-bottom: 25px; }
-        .gamma-summary-card { background: #1a1a1a; padding: 20px; border-radius: 8px; text-align: center; border: 1px solid #333; }
-        .gamma-summary-label { font-size: 11px; color: #888; text-transform: uppercase; margin-bottom: 8px; }
-        .gamma-summary-value { font-size: 22px; font-weight: 700; color: #fff; }
-        .gamma-table { width: 100%; border-collapse: collapse; background: #1a1a1a; border-radius: 8px; overflow: hidden; }
-        .gamma-table th { background: #0a0a0a; padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333; }
-        .gamma-table td { padding: 12px; border-bottom: 1px solid #222; font-size: 13px; }
-        .gamma-table tr:hover { background: #222; }
-        .squeeze-direction { padding: 4px 8px; border-radius: 4px; font-size: 11px; font-weight: 600; text-transform: uppercase; display: inline-block; }
-        .squeeze-direction.upward { background: rgba(0, 255, 136, 0.2); color: #00ff88; border: 1px solid #00ff88; }
-        .squeeze-direction.downward { background: rgba(255, 68, 68, 0.2); color: #ff4444; border: 1px solid #ff4444; }
-        .risk-badge { padding: 3px 8px; border-radius: 4px; font-size: 10px; font-weight: 600; text-transform: uppercase; }
-        .risk-badge.high { background: #ff4444; color: #fff; }
-        .risk-badge.medium { background: #ffaa00; color: #000; }
-        .risk-badge.low { background: #00ff88; color: #000; }
-        .flip-point-indicator { display: flex; align-items: center; gap: 8px; }
-        .flip-arrow { font-size: 16px; }
-        .footer { text-align: center; padding: 20px; border-top: 1px solid #333; margin-top: 40px; color: #666; font-size: 12px; }
-        .last-update { color: #888; font-size: 11px; text-align: right; margin-top: 10px; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div class="logo">OI Pattern Tracker</div>
-            <div class="header-stats">
-                <div class="header-stat">
-                    <div class="stat-label">Patterns Found</div>
-                    <div class="stat-value">{{patterns_found}}</div>
-                </div>
-                <div class="header-stat">
-                    <div class="stat-label">Stocks Analyzed</div>
-                    <div class="stat-value">{{stocks_analyzed}}</div>
-                </div>
-                <div class="header-stat">
-                    <div class="stat-label">Success Rate</div>
-                    <div class="stat-value green">{{avg_success_rate}}</div>
-                </div>
-                <div class="header-stat">
-                    <div class="stat-label">Active Signals</div>
-                    <div class="stat-value yellow">{{active_signals}}</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="market-pulse">
-            <div class="section-title">
-                <div class="pulse-icon"></div>
-                Market Pulse - {{last_update}}
-            </div>
-            <div class="pulse-grid">
-                <div class="pulse-card">
-                    <div class="pulse-metric">Overall Sentiment</div>
-                    <div class="pulse-value positive">{{market_pulse.overall_sentiment}}</div>
-                    <div class="pulse-change positive">{{market_pulse.sentiment_change}}</div>
-                </div>
-                <div class="pulse-card">
-                    <div class="pulse-metric">Institutional Flow</div>
-                    <div class="pulse-value positive">{{market_pulse.institutional_flow}}</div>
-                    <div class="pulse-change positive">{{market_pulse.flow_change}}</div>
-                </div>
-                <div class="pulse-card">
-                    <div class="pulse-metric">VIX Level</div>
-                    <div class="pulse-value">{{market_pulse.vix_level}}</div>
-                    <div class="pulse-change">{{market_pulse.vix_change}}</div>
-                </div>
-                <div class="pulse-card">
-                    <div class="pulse-metric">Key Events</div>
-                    <div class="pulse-value">{{market_pulse.key_events}}</div>
-                </div>
-                <div class="pulse-card">
-                    <div class="pulse-metric">Gamma Exposure</div>
-                    <div class="pulse-value">{{market_pulse.gamma_exposure}}</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="options-signals-section" style="background: #111; border: 1px solid #333; border-radius: 12px; padding: 25px; margin-bottom: 25px;">
-            <div class="section-title">📊 Options Signal Summary</div>
-            
-            <div style="display: grid; grid-template-columns: 1fr 1fr 1fr 1fr; gap: 20px; margin-bottom: 20px;">
-                <!-- BULLISH CALLS -->
-                <div style="background: #1a1a1a; border: 2px solid #00ff88; border-radius: 10px; padding: 20px;">
-                    <div style="text-align: center; margin-bottom: 15px;">
-                        <div style="font-size: 16px; font-weight: 600; color: #00ff88; margin-bottom: 5px;">🟢 BULLISH CALLS</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #fff;">{{options_signals.total_bullish}}</div>
-                        <div style="font-size: 11px; color: #888; margin-top: 5px;">Tickers with call bias</div>
-                    </div>
-                    <div style="font-size: 11px; color: #00ff88; margin-bottom: 10px; text-transform: uppercase; font-weight: 600;">Criteria Met:</div>
-                    <div style="font-size: 10px; color: #ccc; line-height: 1.4; margin-bottom: 15px;">
-                        • Put/Call ratio < 0.5<br>
-                        • Heavy call OI concentration<br>
-                        • Bullish flow positioning<br>
-                        • Accumulation patterns
-                    </div>
-                    {% if options_signals.bullish_calls %}
-                    <div style="max-height: 200px; overflow-y: auto;">
-                        {% for signal in options_signals.bullish_calls %}
-                        <div style="background: #0a0a0a; padding: 8px; margin-bottom: 6px; border-radius: 5px; border-left: 3px solid #00ff88;">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <span style="font-weight: 600; color: #fff;">{{signal.ticker}}</span>
-                                <span style="font-size: 10px; color: #00ff88;">{{signal.signal_strength}}</span>
-                            </div>
-                            <div style="font-size: 10px; color: #888; margin-top: 2px;">
-                                P/C: {{signal.pc_ratio}} | {{signal.pattern}}
-                                {% if signal.directional_bias and signal.directional_bias != "Unknown" %}
-                                <br><span style="color: #00ff88; font-size: 9px;">{{signal.directional_bias}}</span>
-                                {% endif %}
-                            </div>
-                        </div>
-                        {% endfor %}
-                    </div>
-                    {% else %}
-                    <div style="text-align: center; color: #666; font-size: 12px; padding: 20px;">No tickers meet bullish call criteria</div>
-                    {% endif %}
-                </div>
-                
-                <!-- BEARISH PUTS -->
-                <div style="background: #1a1a1a; border: 2px solid #ff4444; border-radius: 10px; padding: 20px;">
-                    <div style="text-align: center; margin-bottom: 15px;">
-                        <div style="font-size: 16px; font-weight: 600; color: #ff4444; margin-bottom: 5px;">🔴 BEARISH PUTS</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #fff;">{{options_signals.total_bearish}}</div>
-                        <div style="font-size: 11px; color: #888; margin-top: 5px;">Tickers with put bias</div>
-                    </div>
-                    <div style="font-size: 11px; color: #ff4444; margin-bottom: 10px; text-transform: uppercase; font-weight: 600;">Criteria Met:</div>
-                    <div style="font-size: 10px; color: #ccc; line-height: 1.4; margin-bottom: 15px;">
-                        • Put/Call ratio > 1.5<br>
-                        • Heavy put OI at key levels<br>
-                        • Bearish flow positioning<br>
-                        • Distribution patterns
-                    </div>
-                    {% if options_signals.bearish_puts %}
-                    <div style="max-height: 200px; overflow-y: auto;">
-                        {% for signal in options_signals.bearish_puts %}
-                        <div style="background: #0a0a0a; padding: 8px; margin-bottom: 6px; border-radius: 5px; border-left: 3px solid #ff4444;">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <span style="font-weight: 600; color: #fff;">{{signal.ticker}}</span>
-                                <span style="font-size: 10px; color: #ff4444;">{{signal.signal_strength}}</span>
-                            </div>
-                            <div style="font-size: 10px; color: #888; margin-top: 2px;">
-                                P/C: {{signal.pc_ratio}} | {{signal.pattern}}
-                                {% if signal.directional_bias and signal.directional_bias != "Unknown" %}
-                                <br><span style="color: #ff4444; font-size: 9px;">{{signal.directional_bias}}</span>
-                                {% endif %}
-                            </div>
-                        </div>
-                        {% endfor %}
-                    </div>
-                    {% else %}
-                    <div style="text-align: center; color: #666; font-size: 12px; padding: 20px;">No tickers meet bearish put criteria</div>
-                    {% endif %}
-                </div>
-                
-                <!-- PUT CREDIT SPREADS -->
-                <div style="background: #1a1a1a; border: 2px solid #8a2be2; border-radius: 10px; padding: 20px;">
-                    <div style="text-align: center; margin-bottom: 15px;">
-                        <div style="font-size: 16px; font-weight: 600; color: #8a2be2; margin-bottom: 5px;">🟣 PUT SPREADS</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #fff;">{{options_signals.total_put_spreads}}</div>
-                        <div style="font-size: 11px; color: #888; margin-top: 5px;">Strong put walls</div>
-                    </div>
-                    <div style="font-size: 11px; color: #8a2be2; margin-bottom: 10px; text-transform: uppercase; font-weight: 600;">Criteria Met:</div>
-                    <div style="font-size: 10px; color: #ccc; line-height: 1.4; margin-bottom: 15px;">
-                        • Massive put OI (>50K contracts)<br>
-                        • Price >3% above max pain<br>
-                        • Strong support levels<br>
-                        • >5% safety margin
-                    </div>
-                    {% if options_signals.put_credit_spreads %}
-                    <div style="max-height: 200px; overflow-y: auto;">
-                        {% for signal in options_signals.put_credit_spreads %}
-                        <div style="background: #0a0a0a; padding: 8px; margin-bottom: 6px; border-radius: 5px; border-left: 3px solid #8a2be2;">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <span style="font-weight: 600; color: #fff;">{{signal.ticker}}</span>
-                                <span style="font-size: 10px; color: #8a2be2;">{{signal.signal_strength}}</span>
-                            </div>
-                            <div style="font-size: 10px; color: #888; margin-top: 2px;">
-                                Max Pain: {{signal.max_pain_level}} | Safety: {{signal.safety_margin}}
-                                {% if signal.directional_bias and signal.directional_bias != "Unknown" %}
-                                <br><span style="color: #8a2be2; font-size: 9px;">{{signal.directional_bias}}</span>
-                                {% endif %}
-                                {% if signal.put_wall_strikes %}
-                                <br><span style="color: #ccc; font-size: 9px;">Put Walls: 
-                                {% for wall in signal.put_wall_strikes %}
-                                ${{wall.strike|round}} {% if not loop.last %}, {% endif %}
-                                {% endfor %}
-                                </span>
-                                {% endif %}
-                            </div>
-                        </div>
-                        {% endfor %}
-                    </div>
-                    {% else %}
-                    <div style="text-align: center; color: #666; font-size: 12px; padding: 20px;">No strong put walls detected</div>
-                    {% endif %}
-                </div>
-                
-                <!-- NEUTRAL/MIXED -->
-                <div style="background: #1a1a1a; border: 2px solid #ffaa00; border-radius: 10px; padding: 20px;">
-                    <div style="text-align: center; margin-bottom: 15px;">
-                        <div style="font-size: 16px; font-weight: 600; color: #ffaa00; margin-bottom: 5px;">⚪ NEUTRAL/MIXED</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #fff;">{{options_signals.total_neutral}}</div>
-                        <div style="font-size: 11px; color: #888; margin-top: 5px;">Inconclusive signals</div>
-                    </div>
-                    <div style="font-size: 11px; color: #ffaa00; margin-bottom: 10px; text-transform: uppercase; font-weight: 600;">Characteristics:</div>
-                    <div style="font-size: 10px; color: #ccc; line-height: 1.4; margin-bottom: 15px;">
-                        • Mixed P/C ratios (0.5-1.5)<br>
-                        • Balanced OI distribution<br>
-                        • Unclear directional bias<br>
-                        • Wait for clearer signals
-                    </div>
-                    {% if options_signals.neutral_tickers %}
-                    <div style="max-height: 200px; overflow-y: auto;">
-                        {% for signal in options_signals.neutral_tickers %}
-                        <div style="background: #0a0a0a; padding: 8px; margin-bottom: 6px; border-radius: 5px; border-left: 3px solid #ffaa00;">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <span style="font-weight: 600; color: #fff;">{{signal.ticker}}</span>
-                                <span style="font-size: 10px; color: #ffaa00;">{{signal.signal_strength}}</span>
-                            </div>
-                            <div style="font-size: 10px; color: #888; margin-top: 2px;">
-                                P/C: {{signal.pc_ratio}} | {{signal.pattern}}
-                                {% if signal.directional_bias and signal.directional_bias != "Unknown" %}
-                                <br><span style="color: #ffaa00; font-size: 9px;">{{signal.directional_bias}}</span>
-                                {% endif %}
-                            </div>
-                        </div>
-                        {% endfor %}
-                    </div>
-                    {% else %}
-                    <div style="text-align: center; color: #666; font-size: 12px; padding: 20px;">All tickers have clear directional bias</div>
-                    {% endif %}
-                </div>
-            </div>
-            
-            <div style="background: #0a0a0a; padding: 15px; border-radius: 8px; border-left: 4px solid #00ff88;">
-                <div style="font-size: 12px; color: #00ff88; font-weight: 600; margin-bottom: 8px;">📖 SIGNAL INTERPRETATION:</div>
-                <div style="font-size: 11px; color: #ccc; line-height: 1.4;">
-                    <strong>Bullish Calls:</strong> Strong call buying interest with low put protection - institutions positioning for upside<br>
-                    <strong>Bearish Puts:</strong> Heavy put accumulation with call selling - smart money hedging or betting on downside<br>
-                    <strong>Put Credit Spreads:</strong> Massive put walls creating strong support levels - ideal for selling premium with defined risk<br>
-                    <strong>Neutral:</strong> Balanced positioning or conflicting signals - wait for clearer directional confirmation<br>
-                    <strong>Signal Strength:</strong> Strong = 3+ criteria met, Moderate = 2 criteria, Weak = 1 criteria
-                </div>
-            </div>
-        </div>
-
-        {% if has_multi_timeframe %}
-        <!-- Multi-Timeframe Analysis Section -->
-        <div style="background: #111; border: 1px solid #333; border-radius: 12px; padding: 25px; margin-bottom: 25px;">
-            <div class="section-title">
-                🔄 Multi-Timeframe Analysis
-                <span style="background: #00ff88; color: #000; padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 600; margin-left: 15px;">NEW</span>
-            </div>
-
-            <!-- Confluence Summary -->
-            <div style="background: #0a0a0a; border: 1px solid #333; border-radius: 8px; padding: 20px; margin-bottom: 25px;">
-                <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 20px; margin-bottom: 20px;">
-                    <div style="text-align: center;">
-                        <div style="font-size: 11px; color: #888; text-transform: uppercase; margin-bottom: 8px;">Total Tickers</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #fff;">{{confluence_summary.total_tickers}}</div>
-                    </div>
-                    <div style="text-align: center;">
-                        <div style="font-size: 11px; color: #888; text-transform: uppercase; margin-bottom: 8px;">Aligned Signals</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #00ff88;">{{confluence_summary.aligned_signals}}</div>
-                    </div>
-                    <div style="text-align: center;">
-                        <div style="font-size: 11px; color: #888; text-transform: uppercase; margin-bottom: 8px;">Divergent Signals</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #ff4444;">{{confluence_summary.divergent_signals}}</div>
-                    </div>
-                    <div style="text-align: center;">
-                        <div style="font-size: 11px; color: #888; text-transform: uppercase; margin-bottom: 8px;">Alignment Rate</div>
-                        <div style="font-size: 24px; font-weight: 700; color: #ffaa00;">{{confluence_summary.alignment_rate}}</div>
-                    </div>
-                </div>
-
-                <div style="font-size: 12px; color: #888; margin-bottom: 8px; text-transform: uppercase;">📊 Timeframe Statistics</div>
-                <table style="width: 100%; border-collapse: collapse; background: #1a1a1a; border-radius: 8px; overflow: hidden;">
-                    <thead>
-                        <tr style="background: #0a0a0a;">
-                            <th style="padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333;">DTE</th>
-                            <th style="padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333;">Total Signals</th>
-                            <th style="padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333;">Bullish</th>
-                            <th style="padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333;">Bearish</th>
-                            <th style="padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333;">Bullish %</th>
-                            <th style="padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333;">Avg Confidence</th>
-                            <th style="padding: 12px; text-align: left; font-size: 11px; text-transform: uppercase; color: #888; font-weight: 600; border-bottom: 1px solid #333;">Market Bias</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {% for timeframe in timeframe_comparison %}
-                        <tr style="border-bottom: 1px solid #222;">
-                            <td style="padding: 12px; font-size: 13px; font-weight: 700; color: #fff;">{{timeframe.dte}} DTE</td>
-                            <td style="padding: 12px; font-size: 13px;">{{timeframe.total_signals}}</td>
-                            <td style="padding: 12px; font-size: 13px; color: #00ff88;">{{timeframe.bullish_signals}}</td>
-                            <td style="padding: 12px; font-size: 13px; color: #ff4444;">{{timeframe.bearish_signals}}</td>
-                            <td style="padding: 12px; font-size: 13px; font-weight: 600;">{{timeframe.bullish_percentage}}</td>
-                            <td style="padding: 12px; font-size: 13px;">{{timeframe.avg_confidence}}</td>
-                            <td style="padding: 12px; font-size: 13px;">
-                                <span style="padding: 4px 8px; border-radius: 4px; font-size: 11px; font-weight: 600; text-transform: uppercase; {% if timeframe.bias_class == 'success' %}background: rgba(0, 255, 136, 0.2); color: #00ff88; border: 1px solid #00ff88;{% elif timeframe.bias_class == 'danger' %}background: rgba(255, 68, 68, 0.2); color: #ff4444; border: 1px solid #ff4444;{% else %}background: rgba(255, 170, 0, 0.2); color: #ffaa00; border: 1px solid #ffaa00;{% endif %}">
-                                    {{timeframe.market_bias}}
-                                </span>
-                            </td>
-                        </tr>
-                        {% endfor %}
-                    </tbody>
-                </table>
-            </div>
-
-            <!-- Individual Ticker Multi-Timeframe Analysis -->
-            <div style="font-size: 18px; font-weight: 600; color: #fff; margin-bottom: 20px;">Individual Ticker Analysis</div>
-            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(600px, 1fr)); gap: 25px;">
-                {% for ticker_data in multi_timeframe_trades %}
-                <div style="background: #1a1a1a; border: 2px solid #333; border-radius: 12px; overflow: hidden; {% if ticker_data.confluence_class == 'success' %}border-left: 4px solid #00ff88;{% elif ticker_data.confluence_class == 'warning' %}border-left: 4px solid #ffaa00;{% else %}border-left: 4px solid #666;{% endif %}">
-                    <!-- Ticker Header -->
-                    <div style="background: #0a0a0a; padding: 20px; border-bottom: 1px solid #333;">
-                        <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div style="font-size: 24px; font-weight: 700; color: #fff;">{{ticker_data.ticker}}</div>
-                            <div style="text-align: right;">
-                                <div style="font-size: 12px; color: #888; margin-bottom: 4px;">CONFLUENCE</div>
-                                <div style="padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 600; {% if ticker_data.confluence_class == 'success' %}background: #00ff88; color: #000;{% elif ticker_data.confluence_class == 'warning' %}background: #ffaa00; color: #000;{% else %}background: #666; color: #fff;{% endif %}">
-                                    {{ticker_data.confluence_type.upper()}}
-                                </div>
-                                <div style="font-size: 11px; color: #888; margin-top: 4px;">Avg: {{ticker_data.avg_confidence|round}}%</div>
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Timeframe Comparison -->
-                    <div style="padding: 20px;">
-                        <div style="font-size: 12px; color: #888; margin-bottom: 15px; text-transform: uppercase; font-weight: 600;">Timeframe Analysis</div>
-                        <div style="background: #0a0a0a; border-radius: 8px; overflow: hidden;">
-                            <table style="width: 100%; border-collapse: collapse;">
-                                <thead>
-                                    <tr style="background: #111;">
-                                        <th style="padding: 10px; font-size: 10px; text-transform: uppercase; color: #888; text-align: left; border-bottom: 1px solid #333;">DTE</th>
-                                        <th style="padding: 10px; font-size: 10px; text-transform: uppercase; color: #888; text-align: left; border-bottom: 1px solid #333;">Direction</th>
-                                        <th style="padding: 10px; font-size: 10px; text-transform: uppercase; color: #888; text-align: left; border-bottom: 1px solid #333;">Confidence</th>
-                                        <th style="padding: 10px; font-size: 10px; text-transform: uppercase; color: #888; text-align: left; border-bottom: 1px solid #333;">Success Prob</th>
-                                        <th style="padding: 10px; font-size: 10px; text-transform: uppercase; color: #888; text-align: left; border-bottom: 1px solid #333;">Pattern</th>
-                                    </tr>
-                                </thead>
-                                <tbody>
-                                    {% for tf in ticker_data.timeframes %}
-                                    <tr style="border-bottom: 1px solid #222;">
-                                        <td style="padding: 10px; font-size: 12px; font-weight: 600; color: #fff;">{{tf.dte}}D</td>
-                                        <td style="padding: 10px; font-size: 12px;">
-                                            <span style="padding: 3px 8px; border-radius: 4px; font-size: 10px; font-weight: 600; text-transform: uppercase; {% if tf.direction_class == 'bullish' %}background: rgba(0, 255, 136, 0.2); color: #00ff88; border: 1px solid #00ff88;{% else %}background: rgba(255, 68, 68, 0.2); color: #ff4444; border: 1px solid #ff4444;{% endif %}">
-                                                {{tf.direction}}
-                                            </span>
-                                        </td>
-                                        <td style="padding: 10px; font-size: 12px; color: {{tf.direction_color}};">{{tf.confidence}}%</td>
-                                        <td style="padding: 10px; font-size: 12px; color: {{tf.direction_color}};">{{tf.success_probability}}%</td>
-                                        <td style="padding: 10px; font-size: 11px; color: #ccc;">{{tf.pattern_type}}</td>
-                                    </tr>
-                                    {% endfor %}
-                                </tbody>
-                            </table>
-                        </div>
-
-                        <!-- Confluence Analysis -->
-                        <div style="margin-top: 15px; padding: 15px; background: #0a0a0a; border-radius: 8px; border-left: 4px solid {% if ticker_data.confluence_class == 'success' %}#00ff88{% elif ticker_data.confluence_class == 'warning' %}#ffaa00{% else %}#666{% endif %};">
-                            <div style="font-size: 11px; color: {% if ticker_data.confluence_class == 'success' %}#00ff88{% elif ticker_data.confluence_class == 'warning' %}#ffaa00{% else %}#888{% endif %}; font-weight: 600; margin-bottom: 8px; text-transform: uppercase;">
-                                {% if ticker_data.confluence_type == 'aligned' %}✅ TIMEFRAME ALIGNED
-                                {% elif ticker_data.confluence_type == 'divergent' %}⚠️ CONFLICTING SIGNALS
-                                {% else %}❓ UNCLEAR DIRECTION{% endif %}
-                            </div>
-                            <div style="font-size: 11px; color: #ccc; line-height: 1.4;">
-                                {% if ticker_data.confluence_type == 'aligned' %}
-                                    All timeframes show consistent {{ticker_data.overall_direction}} positioning. High conviction institutional signal.
-                                {% elif ticker_data.confluence_type == 'divergent' %}
-                                    Short-term vs long-term signals conflict. Suggests tactical trading vs strategic positioning by institutions.
-                                {% else %}
-                                    Mixed or unclear signals across timeframes. Wait for directional clarity.
-                                {% endif %}
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                {% endfor %}
-            </div>
-
-            <div style="margin-top: 20px; padding: 15px; background: #0a0a0a; border-radius: 8px; border-left: 4px solid #00ff88;">
-                <div style="font-size: 12px; color: #00ff88; font-weight: 600; margin-bottom: 8px;">📖 MULTI-TIMEFRAME INSIGHTS:</div>
-                <div style="font-size: 11px; color: #ccc; line-height: 1.4;">
-                    <strong>Aligned Signals:</strong> When all timeframes agree, institutions show consistent positioning - highest conviction trades<br>
-                    <strong>Divergent Signals:</strong> Short-term bullish but long-term bearish often indicates profit-taking with hedging<br>
-                    <strong>Timeframe Evolution:</strong> Patterns can strengthen, weaken, or reverse as time horizon changes<br>
-                    <strong>Trading Strategy:</strong> Use short-term signals for entries, long-term signals for position sizing and risk management
-                </div>
-            </div>
-        </div>
-        {% endif %}
-
-        <div class="gamma-section">
-            <div class="section-title">⚡ Gamma Squeeze Detection</div>
-            
-            <div class="gamma-summary">
-                <div class="gamma-summary-card">
-                    <div class="gamma-summary-label">Total Setups</div>
-                    <div class="gamma-summary-value">{{gamma_squeeze_data.total_setups}}</div>
-                </div>
-                <div class="gamma-summary-card">
-                    <div class="gamma-summary-label">High Risk</div>
-                    <div class="gamma-summary-value" style="color: #ff4444;">{{gamma_squeeze_data.high_risk_count}}</div>
-                </div>
-                <div class="gamma-summary-card">
-                    <div class="gamma-summary-label">Upward Squeeze</div>
-                    <div class="gamma-summary-value" style="color: #00ff88;">{{gamma_squeeze_data.upward_squeeze_count}}</div>
-                </div>
-                <div class="gamma-summary-card">
-                    <div class="gamma-summary-label">Avg Distance</div>
-                    <div class="gamma-summary-value" style="color: #ffaa00;">{{gamma_squeeze_data.avg_flip_distance}}</div>
-                </div>
-            </div>
-            
-            {% if gamma_squeeze_data.gamma_setups %}
-            <table class="gamma-table">
-                <thead>
-                    <tr>
-                        <th>Ticker</th>
-                        <th>Current Price</th>
-                        <th>Gamma Flip Point</th>
-                        <th>Distance</th>
-                        <th>Squeeze Direction</th>
-                        <th>Risk Level</th>
-                        <th>Net Exposure</th>
-                        <th>Volatility Impact</th>
-                        <th>Pattern</th>
-                        <th>Confidence</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for setup in gamma_squeeze_data.gamma_setups %}
-                    <tr>
-                        <td class="ticker-cell">{{setup.ticker}}</td>
-                        <td>{{setup.current_price}}</td>
-                        <td>
-                            <div class="flip-point-indicator">
-                                {{setup.flip_point}}
-                                <span class="flip-arrow" style="color: {{setup.direction_color}};">
-                                    {% if setup.squeeze_direction == "Upward" %}↗{% else %}↘{% endif %}
-                                </span>
-                            </div>
-                        </td>
-                        <td>{{setup.flip_distance}}</td>
-                        <td>
-                            <span class="squeeze-direction {{setup.direction_class}}">
-                                {{setup.squeeze_direction}}
-                            </span>
-                        </td>
-                        <td>
-                            <span class="risk-badge {{setup.squeeze_risk.lower()}}">
-                                {{setup.squeeze_risk}}
-                            </span>
-                        </td>
-                        <td style="font-size: 11px; color: #ccc;">{{setup.net_exposure}}</td>
-                        <td style="font-size: 11px; color: #ccc;">{{setup.volatility_impact}}</td>
-                        <td style="font-size: 11px; color: #888;">{{setup.pattern_type}}</td>
-                        <td style="color: {{setup.direction_color}}; font-weight: 600;">{{setup.confidence}}</td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-            {% else %}
-            <div style="text-align: center; padding: 40px; color: #888;">
-                <div style="font-size: 18px; margin-bottom: 10px;">🔍</div>
-                <div>No gamma squeeze setups detected in current analysis</div>
-                <div style="font-size: 12px; margin-top: 8px;">Check back during high volatility periods</div>
-            </div>
-            {% endif %}
-            
-            <div style="margin-top: 20px; padding: 15px; background: #0a0a0a; border-radius: 8px; border-left: 4px solid #ffaa00;">
-                <div style="font-size: 12px; color: #ffaa00; font-weight: 600; margin-bottom: 8px;">📖 GAMMA SQUEEZE GUIDE:</div>
-                <div style="font-size: 11px; color: #ccc; line-height: 1.4;">
-                    <strong>Upward Squeeze:</strong> Price above flip point → Market makers buy stock as price rises (accelerates moves)<br>
-                    <strong>Downward Squeeze:</strong> Price below flip point → Market makers sell stock as price rises (creates resistance)<br>
-                    <strong>High Risk:</strong> Large options positioning near flip point creates volatile conditions<br>
-                    <strong>Distance:</strong> How far current price is from gamma flip point (closer = higher volatility)
-                </div>
-            </div>
-        </div>
-        
-        <div class="conviction-section">
-            <div class="section-title">
-                🎯 High Conviction Trades
-                <span style="background: #00ff88; color: #000; padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 600; margin-left: 15px;">MULTI-TIMEFRAME</span>
-            </div>
-            <div class="trade-cards">
-                {% for trade in consolidated_high_conviction_trades %}
-                <div class="trade-card consensus-{{trade.consensus_direction}}"
-                     data-ticker="{{trade.ticker}}"
-                     onclick="openInteractiveAnalysis('{{trade.ticker}}', '{{trade.consensus_direction}}')">
-                    <div class="click-hint">Click for interactive session</div>
-
-                    <!-- Enhanced Card Header -->
-                    <div class="card-header">
-                        <div class="ticker-main-info">
-                            <div>
-                                <div class="ticker-symbol">{{trade.ticker}}</div>
-                                <div class="current-price">${{trade.current_price}}</div>
-                            </div>
-                            <div class="consensus-indicator">
-                                <span class="confluence-status {{trade.confluence_status}}">
-                                    {% if trade.confluence_status == 'aligned' %}✅ ALIGNED
-                                    {% elif trade.confluence_status == 'divergent' %}⚠️ DIVERGENT
-                                    {% else %}⚡ PARTIAL{% endif %}
-                                </span>
-                                <span class="dominant-direction {{trade.consensus_direction}}">
-                                    {{trade.consensus_direction|upper}} CONSENSUS
-                                </span>
-                            </div>
-                        </div>
-
-                        <!-- Dynamic Timeframe Tabs -->
-                        <div class="card-timeframe-tabs">
-                            {% for dte, data in trade.timeframes.items() %}
-                            <div class="card-tab {% if loop.first %}active{% endif %}
-                                      {% if data.confidence|replace('%', '')|int >= 75 %}high-confidence
-                                      {% elif data.confidence|replace('%', '')|int >= 50 %}medium-confidence
-                                      {% else %}low-confidence{% endif %}
-                                      {% if data.direction != trade.consensus_direction %}conflicting{% endif %}"
-                                 data-dte="{{dte}}"
-                                 onclick="event.stopPropagation(); switchConsolidatedTab('{{trade.ticker}}', '{{dte}}');">
-                                <span class="dte-label">{{dte}}D</span>
-                                <span class="confidence-mini">{{data.confidence}}</span>
-                                {% if data.direction != trade.consensus_direction %}
-                                <span class="conflict-indicator">⚠️</span>
-                                {% endif %}
-                            </div>
-                            {% endfor %}
-                        </div>
-                    </div>
-
-                    <!-- Timeframe Content Panels -->
-                    <div class="timeframe-content">
-                        {% for dte, data in trade.timeframes.items() %}
-                        <div class="timeframe-panel {% if loop.first %}active{% endif %}"
-                             id="{{trade.ticker}}-{{dte}}">
-
-                            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-                                <div class="pattern-type {{data.direction}}">{{data.pattern_type}}</div>
-                                <div class="confidence-badge {% if data.direction == 'bearish' %}bearish{% endif %}">
-                                    {{data.confidence}} CONFIDENCE
-                                </div>
-                            </div>
-
-                            <div class="trade-details">
-                                <div class="trade-row">
-                                    <span class="trade-label">Strategy:</span>
-                                    <span class="trade-value">{{data.direction|title}}</span>
-                                </div>
-                                <div class="trade-row">
-                                    <span class="trade-label">Entry:</span>
-                                    <span class="trade-value">{{data.entry}}</span>
-                                </div>
-                                <div class="trade-row">
-                                    <span class="trade-label">Target:</span>
-                                    <span class="trade-value">{{data.target}}</span>
-                                </div>
-                                <div class="trade-row">
-                                    <span class="trade-label">Stop Loss:</span>
-                                    <span class="trade-value">{{data.stop_loss}}</span>
-                                </div>
-                                <div class="trade-row">
-                                    <span class="trade-label">Risk/Reward:</span>
-                                    <span class="trade-value">{{data.risk_reward}}</span>
-                                </div>
-                                <div class="trade-row">
-                                    <span class="trade-label">Success Prob:</span>
-                                    <span class="trade-value">{{data.success_prob}}</span>
-                                </div>
-                                <div class="trade-row">
-                                    <span class="trade-label">Expiry:</span>
-                                    <span class="trade-value">{{data.expiry}} ({{data.dte}} DTE)</span>
-                                </div>
-                            </div>
-
-                            <!-- Complete LLM Analysis -->
-                            <div style="background: #0a0a0a; border: 1px solid #333; border-radius: 8px; padding: 15px; margin-bottom: 15px;">
-                                <div style="font-size: 12px; color: #00ff88; margin-bottom: 15px; text-transform: uppercase; font-weight: 600;">🧠 Complete LLM Analysis ({{dte}}D Timeframe)</div>
-
-                                <!-- Market Summary -->
-                                {% if data.market_summary %}
-                                <div style="margin-bottom: 15px;">
-                                    <div style="font-size: 11px; color: #ffaa00; margin-bottom: 8px; text-transform: uppercase; font-weight: 600;">📊 Market Summary:</div>
-                                    <div style="font-size: 12px; color: #e0e0e0; line-height: 1.4; background: #111; padding: 10px; border-radius: 5px;">{{data.market_summary}}</div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Pattern Analysis -->
-                                {% if data.pattern_analysis %}
-                                <div style="margin-bottom: 15px;">
-                                    <div style="font-size: 11px; color: #ffaa00; margin-bottom: 8px; text-transform: uppercase; font-weight: 600;">🔍 Pattern Analysis:</div>
-                                    <div style="background: #111; padding: 10px; border-radius: 5px;">
-                                        {% if data.pattern_analysis.pattern_strength %}
-                                        <div style="font-size: 11px; color: #ccc; margin-bottom: 6px;"><strong>Strength:</strong> {{data.pattern_analysis.pattern_strength|title}}</div>
-                                        {% endif %}
-                                        {% if data.pattern_analysis.confidence_score %}
-                                        <div style="font-size: 11px; color: #ccc; margin-bottom: 6px;"><strong>Confidence:</strong> {{data.pattern_analysis.confidence_score}}</div>
-                                        {% endif %}
-                                        {% if data.pattern_analysis.oi_intelligence %}
-                                        <div style="font-size: 11px; color: #00ff88; margin-bottom: 6px;"><strong>OI Intelligence:</strong></div>
-                                        {% if data.pattern_analysis.oi_intelligence.strike_concentration %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px; margin-bottom: 4px;">• Strike Concentration: {{data.pattern_analysis.oi_intelligence.strike_concentration}}</div>
-                                        {% endif %}
-                                        {% if data.pattern_analysis.oi_intelligence.flow_direction %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px; margin-bottom: 4px;">• Flow Direction: {{data.pattern_analysis.oi_intelligence.flow_direction}}</div>
-                                        {% endif %}
-                                        {% if data.pattern_analysis.oi_intelligence.position_type %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px; margin-bottom: 4px;">• Position Type: {{data.pattern_analysis.oi_intelligence.position_type}}</div>
-                                        {% endif %}
-                                        {% if data.pattern_analysis.oi_intelligence.size_significance %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px;">• Size Significance: {{data.pattern_analysis.oi_intelligence.size_significance}}</div>
-                                        {% endif %}
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Trade Recommendation Details -->
-                                {% if data.trade_recommendation %}
-                                <div style="margin-bottom: 15px;">
-                                    <div style="font-size: 11px; color: #ffaa00; margin-bottom: 8px; text-transform: uppercase; font-weight: 600;">💡 Trade Recommendation:</div>
-                                    <div style="background: #111; padding: 10px; border-radius: 5px;">
-                                        {% if data.trade_recommendation.specific_entry %}
-                                        <div style="font-size: 11px; color: #00ff88; margin-bottom: 6px;"><strong>Entry Strategy:</strong> {{data.trade_recommendation.specific_entry}}</div>
-                                        {% endif %}
-                                        {% if data.trade_recommendation.timeframe_confluence %}
-                                        <div style="font-size: 11px; color: #ccc; margin-bottom: 6px;"><strong>Timeframe Confluence:</strong> {{data.trade_recommendation.timeframe_confluence}}</div>
-                                        {% endif %}
-                                        {% if data.trade_recommendation.exit_strategy %}
-                                        <div style="font-size: 11px; color: #ccc; margin-bottom: 6px;"><strong>Exit Strategy:</strong> {{data.trade_recommendation.exit_strategy}}</div>
-                                        {% endif %}
-                                        {% if data.trade_recommendation.entry_triggers %}
-                                        <div style="font-size: 11px; color: #00ff88; margin-bottom: 6px;"><strong>Entry Triggers:</strong></div>
-                                        {% for trigger in data.trade_recommendation.entry_triggers %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px;">• {{trigger}}</div>
-                                        {% endfor %}
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Risk Management -->
-                                {% if data.risk_management %}
-                                <div style="margin-bottom: 15px;">
-                                    <div style="font-size: 11px; color: #ff4444; margin-bottom: 8px; text-transform: uppercase; font-weight: 600;">⚠️ Risk Management:</div>
-                                    <div style="background: #111; padding: 10px; border-radius: 5px;">
-                                        {% if data.risk_management.primary_risks %}
-                                        <div style="font-size: 11px; color: #ff4444; margin-bottom: 6px;"><strong>Primary Risks:</strong></div>
-                                        {% for risk in data.risk_management.primary_risks %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px;">• {{risk}}</div>
-                                        {% endfor %}
-                                        {% endif %}
-                                        {% if data.risk_management.hedge_strategy %}
-                                        <div style="font-size: 11px; color: #ccc; margin-top: 6px;"><strong>Hedge Strategy:</strong> {{data.risk_management.hedge_strategy}}</div>
-                                        {% endif %}
-                                        {% if data.risk_management.volatility_considerations %}
-                                        <div style="font-size: 11px; color: #ccc; margin-top: 6px;"><strong>Volatility:</strong> {{data.risk_management.volatility_considerations}}</div>
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Technical Analysis -->
-                                {% if data.technical_analysis %}
-                                <div style="margin-bottom: 15px;">
-                                    <div style="font-size: 11px; color: #8a2be2; margin-bottom: 8px; text-transform: uppercase; font-weight: 600;">📈 Technical Analysis:</div>
-                                    <div style="background: #111; padding: 10px; border-radius: 5px;">
-                                        {% if data.technical_analysis.multi_timeframe_summary %}
-                                        <div style="font-size: 11px; color: #ccc; margin-bottom: 6px;"><strong>Multi-Timeframe:</strong> {{data.technical_analysis.multi_timeframe_summary}}</div>
-                                        {% endif %}
-                                        {% if data.technical_analysis.key_levels %}
-                                        <div style="font-size: 11px; color: #8a2be2; margin-bottom: 6px;"><strong>Key Levels:</strong></div>
-                                        {% if data.technical_analysis.key_levels.support %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px;">• Support: {{data.technical_analysis.key_levels.support}}</div>
-                                        {% endif %}
-                                        {% if data.technical_analysis.key_levels.resistance %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px;">• Resistance: {{data.technical_analysis.key_levels.resistance}}</div>
-                                        {% endif %}
-                                        {% if data.technical_analysis.key_levels.pivot %}
-                                        <div style="font-size: 10px; color: #ccc; margin-left: 10px;">• Pivot: {{data.technical_analysis.key_levels.pivot}}</div>
-                                        {% endif %}
-                                        {% endif %}
-                                        {% if data.technical_analysis.momentum_indicators %}
-                                        <div style="font-size: 11px; color: #ccc; margin-top: 6px;"><strong>Momentum:</strong> {{data.technical_analysis.momentum_indicators}}</div>
-                                        {% endif %}
-                                        {% if data.technical_analysis.volume_analysis %}
-                                        <div style="font-size: 11px; color: #ccc; margin-top: 6px;"><strong>Volume:</strong> {{data.technical_analysis.volume_analysis}}</div>
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Smart Money Thesis (Summary) -->
-                                {% if data.analysis %}
-                                <div style="margin-bottom: 0;">
-                                    <div style="font-size: 11px; color: #00ff88; margin-bottom: 8px; text-transform: uppercase; font-weight: 600;">💎 Smart Money Thesis:</div>
-                                    <div style="font-size: 12px; color: #e0e0e0; line-height: 1.5; background: #111; padding: 10px; border-radius: 5px; border-left: 3px solid #00ff88;">{{data.analysis}}</div>
-                                </div>
-                                {% endif %}
-                            </div>
-
-                            {% if data.supporting_evidence %}
-                            <div style="margin-top: 15px;">
-                                <div style="font-size: 12px; color: #888; margin-bottom: 8px; text-transform: uppercase;">Supporting Evidence:</div>
-                                <ul class="evidence-list">
-                                    {% for evidence in data.supporting_evidence %}
-                                    <li>{{evidence}}</li>
-                                    {% endfor %}
-                                </ul>
-                            </div>
-                            {% endif %}
-
-                            {% if data.smart_money_insights %}
-                            <div style="background: #1a1a1a; border: 1px solid #444; border-radius: 8px; padding: 15px; margin-top: 15px;">
-                                <div style="font-size: 12px; color: #00ff88; margin-bottom: 12px; text-transform: uppercase; font-weight: 600;">🎯 Smart Money Intelligence</div>
-
-                                <!-- Put/Call Dynamics -->
-                                {% if data.smart_money_insights.put_call_dynamics %}
-                                <div style="margin-bottom: 12px;">
-                                    <div style="font-size: 11px; color: #888; margin-bottom: 6px;">PUT/CALL DYNAMICS:</div>
-                                    <div style="display: flex; gap: 15px;">
-                                        <span style="font-size: 10px; color: #fff;">P/C Ratio: <strong style="color: #ffaa00;">{{data.smart_money_insights.put_call_dynamics.ratio}}</strong></span>
-                                        {% if data.smart_money_insights.put_call_dynamics.signal_classification %}
-                                        <span style="font-size: 10px; color: #00ff88;">{{data.smart_money_insights.put_call_dynamics.signal_classification}}</span>
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Enhanced Flow Analysis with Large Blocks & Unusual Activity -->
-                                {% if data.smart_money_insights.flow_analysis %}
-                                <div style="margin-bottom: 12px;">
-                                    <div style="font-size: 11px; color: #888; margin-bottom: 8px;">INSTITUTIONAL FLOW INTELLIGENCE:</div>
-
-                                    <!-- Directional Bias & Net Positioning -->
-                                    <div style="background: #111; border-radius: 5px; padding: 8px; margin-bottom: 8px;">
-                                        {% if data.smart_money_insights.flow_analysis.directional_bias %}
-                                        <div style="font-size: 10px; color: #00ff88; margin-bottom: 4px;"><strong>Direction:</strong> {{data.smart_money_insights.flow_analysis.directional_bias}}</div>
-                                        {% endif %}
-                                        {% if data.smart_money_insights.flow_analysis.net_positioning %}
-                                        <div style="font-size: 10px; color: #ccc;"><strong>Positioning:</strong> {{data.smart_money_insights.flow_analysis.net_positioning}}</div>
-                                        {% endif %}
-                                    </div>
-
-                                    <!-- Large Block Activity -->
-                                    {% if data.smart_money_insights.flow_analysis.large_blocks %}
-                                    <div style="margin-bottom: 8px;">
-                                        <div style="font-size: 9px; color: #ffaa00; font-weight: 600; margin-bottom: 4px;">📊 LARGE BLOCK ACTIVITY:</div>
-                                        {% for block in data.smart_money_insights.flow_analysis.large_blocks %}
-                                        <div style="background: rgba(255,170,0,0.1); border: 1px solid #ffaa00; border-radius: 4px; padding: 6px; margin-bottom: 4px;">
-                                            <div style="font-size: 9px; color: #ccc;">{{block}}</div>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-
-                                    <!-- Unusual Activity Detection -->
-                                    {% if data.smart_money_insights.flow_analysis.unusual_activity %}
-                                    <div style="margin-bottom: 8px;">
-                                        <div style="font-size: 9px; color: #ff4444; font-weight: 600; margin-bottom: 4px;">🚨 UNUSUAL ACTIVITY:</div>
-                                        {% for activity in data.smart_money_insights.flow_analysis.unusual_activity %}
-                                        <div style="background: rgba(255,68,68,0.1); border: 1px solid #ff4444; border-radius: 4px; padding: 6px; margin-bottom: 4px;">
-                                            <div style="font-size: 9px; color: #ccc;">{{activity}}</div>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-
-                                    <!-- Dark Pool Signals -->
-                                    {% if data.smart_money_insights.flow_analysis.dark_pool_signals %}
-                                    <div style="background: #0a0a0a; border-left: 3px solid #8a2be2; padding: 8px;">
-                                        <div style="font-size: 9px; color: #8a2be2; font-weight: 600; margin-bottom: 4px;">🌑 DARK POOL SIGNALS:</div>
-                                        <div style="font-size: 9px; color: #ccc; line-height: 1.3;">{{data.smart_money_insights.flow_analysis.dark_pool_signals}}</div>
-                                    </div>
-                                    {% endif %}
-                                </div>
-                                {% endif %}
-
-                                <!-- Gamma Analysis -->
-                                {% if data.smart_money_insights.gamma_analysis %}
-                                <div style="margin-bottom: 12px;">
-                                    <div style="font-size: 11px; color: #888; margin-bottom: 6px;">GAMMA EXPOSURE:</div>
-                                    <div style="display: flex; gap: 15px;">
-                                        {% if data.smart_money_insights.gamma_analysis.squeeze_risk %}
-                                        <span style="font-size: 10px; color: #ff4444;">Risk: {{data.smart_money_insights.gamma_analysis.squeeze_risk}}</span>
-                                        {% endif %}
-                                        {% if data.smart_money_insights.gamma_analysis.flip_point %}
-                                        <span style="font-size: 10px; color: #ffaa00;">Flip: ${{data.smart_money_insights.gamma_analysis.flip_point}}</span>
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Max Pain Analysis -->
-                                {% if data.smart_money_insights.max_pain_analysis %}
-                                <div style="margin-bottom: 12px;">
-                                    <div style="font-size: 11px; color: #888; margin-bottom: 6px;">MAX PAIN LEVEL:</div>
-                                    <div style="display: flex; gap: 15px;">
-                                        {% if data.smart_money_insights.max_pain_analysis.level %}
-                                        <span style="font-size: 10px; color: #ffaa00;">Level: ${{data.smart_money_insights.max_pain_analysis.level}}</span>
-                                        {% endif %}
-                                        {% if data.smart_money_insights.max_pain_analysis.pin_risk %}
-                                        <span style="font-size: 10px; color: #ccc;">Pin Risk: {{data.smart_money_insights.max_pain_analysis.pin_risk}}</span>
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-
-                                <!-- Enhanced OI Concentration with Complete Cluster Data -->
-                                {% if data.smart_money_insights.oi_concentration_zones %}
-                                <div style="margin-bottom: 12px;">
-                                    <div style="font-size: 11px; color: #888; margin-bottom: 8px;">OI CONCENTRATION CLUSTERS:</div>
-
-                                    <!-- Heavy Call Strikes with Full Details -->
-                                    {% if data.smart_money_insights.oi_concentration_zones.heavy_call_strikes %}
-                                    <div style="margin-bottom: 10px;">
-                                        <div style="font-size: 10px; color: #00ff88; font-weight: 600; margin-bottom: 6px;">🟢 CALL CLUSTERS:</div>
-                                        {% for strike in data.smart_money_insights.oi_concentration_zones.heavy_call_strikes %}
-                                        <div style="background: #004422; border: 1px solid #00ff88; border-radius: 6px; padding: 8px; margin-bottom: 6px;">
-                                            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 4px;">
-                                                <span style="font-size: 11px; color: #00ff88; font-weight: 600;">${{strike.strike}}</span>
-                                                {% if strike.oi %}
-                                                <span style="font-size: 10px; color: #fff; font-weight: 500;">{{strike.oi|number_format}} OI</span>
-                                                {% endif %}
-                                            </div>
-                                            {% if strike.interpretation %}
-                                            <div style="font-size: 9px; color: #ccc; margin-bottom: 3px;">{{strike.interpretation}}</div>
-                                            {% endif %}
-                                            <div style="display: flex; gap: 8px;">
-                                                {% if strike.distance_from_price %}
-                                                <span style="font-size: 8px; color: #ffaa00; background: rgba(255,170,0,0.2); padding: 2px 4px; border-radius: 3px;">{{strike.distance_from_price}}</span>
-                                                {% endif %}
-                                                {% if strike.call_wall_strength %}
-                                                <span style="font-size: 8px; color: #00ff88; background: rgba(0,255,136,0.2); padding: 2px 4px; border-radius: 3px;">{{strike.call_wall_strength}} Wall</span>
-                                                {% endif %}
-                                            </div>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-
-                                    <!-- Heavy Put Strikes with Full Details -->
-                                    {% if data.smart_money_insights.oi_concentration_zones.heavy_put_strikes %}
-                                    <div style="margin-bottom: 10px;">
-                                        <div style="font-size: 10px; color: #ff4444; font-weight: 600; margin-bottom: 6px;">🔴 PUT CLUSTERS:</div>
-                                        {% for strike in data.smart_money_insights.oi_concentration_zones.heavy_put_strikes %}
-                                        <div style="background: #442222; border: 1px solid #ff4444; border-radius: 6px; padding: 8px; margin-bottom: 6px;">
-                                            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 4px;">
-                                                <span style="font-size: 11px; color: #ff4444; font-weight: 600;">${{strike.strike}}</span>
-                                                {% if strike.oi %}
-                                                <span style="font-size: 10px; color: #fff; font-weight: 500;">{{strike.oi|number_format}} OI</span>
-                                                {% endif %}
-                                            </div>
-                                            {% if strike.interpretation %}
-                                            <div style="font-size: 9px; color: #ccc; margin-bottom: 3px;">{{strike.interpretation}}</div>
-                                            {% endif %}
-                                            <div style="display: flex; gap: 8px;">
-                                                {% if strike.distance_from_price %}
-                                                <span style="font-size: 8px; color: #ffaa00; background: rgba(255,170,0,0.2); padding: 2px 4px; border-radius: 3px;">{{strike.distance_from_price}}</span>
-                                                {% endif %}
-                                                {% if strike.put_wall_strength %}
-                                                <span style="font-size: 8px; color: #ff4444; background: rgba(255,68,68,0.2); padding: 2px 4px; border-radius: 3px;">{{strike.put_wall_strength}} Wall</span>
-                                                {% endif %}
-                                            </div>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-
-                                    <!-- Concentration Analysis -->
-                                    {% if data.smart_money_insights.oi_concentration_zones.concentration_analysis %}
-                                    <div style="background: #0a0a0a; border-left: 3px solid #8a2be2; padding: 8px; margin-bottom: 8px;">
-                                        <div style="font-size: 9px; color: #8a2be2; font-weight: 600; margin-bottom: 4px;">🧠 CLUSTER ANALYSIS:</div>
-                                        <div style="font-size: 9px; color: #ccc; line-height: 1.3;">{{data.smart_money_insights.oi_concentration_zones.concentration_analysis}}</div>
-                                    </div>
-                                    {% endif %}
-
-                                    <!-- Put Wall Analysis for Credit Spreads -->
-                                    {% if data.smart_money_insights.oi_concentration_zones.put_wall_analysis %}
-                                    <div style="background: #0a0a0a; border-left: 3px solid #8a2be2; padding: 8px; margin-bottom: 8px;">
-                                        <div style="font-size: 9px; color: #8a2be2; font-weight: 600; margin-bottom: 4px;">🏗️ PUT WALL ANALYSIS:</div>
-                                        <div style="font-size: 9px; color: #ccc; line-height: 1.3;">{{data.smart_money_insights.oi_concentration_zones.put_wall_analysis}}</div>
-                                    </div>
-                                    {% endif %}
-
-                                    <!-- Safety Assessment -->
-                                    {% if data.smart_money_insights.oi_concentration_zones.safety_assessment %}
-                                    <div style="background: #0a0a0a; border-left: 3px solid #ffaa00; padding: 8px;">
-                                        <div style="font-size: 9px; color: #ffaa00; font-weight: 600; margin-bottom: 4px;">⚠️ SAFETY ASSESSMENT:</div>
-                                        <div style="font-size: 9px; color: #ccc; line-height: 1.3;">{{data.smart_money_insights.oi_concentration_zones.safety_assessment}}</div>
-                                    </div>
-                                    {% endif %}
-                                </div>
-                                {% endif %}
-
-                                <!-- Put Credit Spread Analysis -->
-                                {% if data.smart_money_insights.put_credit_spread_analysis %}
-                                <div style="margin-bottom: 0;">
-                                    <div style="font-size: 11px; color: #888; margin-bottom: 6px;">PUT SPREAD SETUP:</div>
-                                    <div style="display: flex; gap: 15px;">
-                                        {% if data.smart_money_insights.put_credit_spread_analysis.suitability %}
-                                        <span style="font-size: 10px; color: #8a2be2;">Suitability: {{data.smart_money_insights.put_credit_spread_analysis.suitability}}</span>
-                                        {% endif %}
-                                        {% if data.smart_money_insights.put_credit_spread_analysis.safety_margin %}
-                                        <span style="font-size: 10px; color: #ccc;">Safety: {{data.smart_money_insights.put_credit_spread_analysis.safety_margin}}</span>
-                                        {% endif %}
-                                    </div>
-                                </div>
-                                {% endif %}
-                            </div>
-                            {% endif %}
-                        </div>
-                        {% endfor %}
-                    </div>
-
-                    <!-- Confidence Evolution Timeline -->
-                    <div class="confidence-evolution">
-                        <div class="evolution-label">CONFIDENCE EVOLUTION</div>
-                        <div class="confidence-timeline">
-                            {% for dte, data in trade.timeframes.items() %}
-                            <div class="timeline-point
-                                      {% if data.confidence|replace('%', '')|int >= 75 %}high
-                                      {% elif data.confidence|replace('%', '')|int >= 50 %}medium
-                                      {% else %}low{% endif %}"></div>
-                            {% if not loop.last %}<div class="timeline-line"></div>{% endif %}
-                            {% endfor %}
-                        </div>
-                        <div class="timeline-labels">
-                            {% for dte, data in trade.timeframes.items() %}
-                            <span class="timeline-label">{{dte}}D: {{data.confidence}}</span>
-                            {% endfor %}
-                        </div>
-                    </div>
-                </div>
-                {% endfor %}
-            </div>
-        </div>
-        
-
-        
-        <div class="recommendations-section">
-            <div class="section-title">📋 Complete Trade Recommendations</div>
-            <table class="recommendations-table">
-                <thead>
-                    <tr>
-                        <th>Ticker</th>
-                        <th>Pattern</th>
-                        <th>Direction</th>
-                        <th>Entry</th>
-                        <th>Target</th>
-                        <th>Expiry</th>
-                        <th>Success Prob</th>
-                        <th>R/R</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for rec in all_recommendations %}
-                    <tr>
-                        <td class="ticker-cell">{{rec.ticker}}</td>
-                        <td>{{rec.pattern}}</td>
-                        <td><span class="direction-badge {{rec.direction.lower()}}">{{rec.direction}}</span></td>
-                        <td>{{rec.entry}}</td>
-                        <td>{{rec.target}}</td>
-                        <td>{{rec.expiry}}</td>
-                        <td class="probability-cell {% if rec.direction == 'CALL' %}positive{% else %}negative{% endif %}">{{rec.success_prob}}</td>
-                        <td>{{rec.risk_reward}}</td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        
-        <div class="footer">
-            <div>OI Pattern Tracker v2.0 | Institutional-grade options flow analysis</div>
-            <div class="last-update">Last updated: {{last_update}} | Next analysis: 4:15 PM ET tomorrow</div>
-        </div>
-    </div>
-    
-    <script>
-        function openInteractiveAnalysis(ticker, direction) {
-            // Show loading indicator
-            const card = event.currentTarget;
-            const originalContent = card.innerHTML;
-            card.style.opacity = '0.7';
-            card.innerHTML = '<div style="text-align: center; padding: 40px;"><div style="color: #00ff88; font-size: 18px; margin-bottom: 10px;">🤖</div><div>Creating analysis session...</div></div>';
-            
-            // Create analysis session
-            fetch('http://localhost:5001/api/create-session', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    ticker: ticker,
-                    direction: direction
-                })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.error) {
-                    alert('Error creating session: ' + data.error);
-                    card.innerHTML = originalContent;
-                    card.style.opacity = '1';
-                } else {
-                    // Open analysis interface in new tab
-                    window.open(`http://localhost:5001/analysis/${data.session_id}`, '_blank');
-                    card.innerHTML = originalContent;
-                    card.style.opacity = '1';
-                }
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                alert('Error creating analysis session. Make sure the interactive service is running.');
-                card.innerHTML = originalContent;
-                card.style.opacity = '1';
-            });
-        }
-
-        function switchConsolidatedTab(ticker, dte) {
-            // Find all tabs and panels for this ticker
-            const card = document.querySelector(`[data-ticker="${ticker}"]`);
-            if (!card) return;
-
-            const tabs = card.querySelectorAll('.card-tab');
-            const panels = card.querySelectorAll('.timeframe-panel');
-
-            // Remove active class from all tabs and panels
-            tabs.forEach(tab => tab.classList.remove('active'));
-            panels.forEach(panel => panel.classList.remove('active'));
-
-            // Add active class to selected tab and panel
-            const selectedTab = card.querySelector(`[data-dte="${dte}"]`);
-            const selectedPanel = card.querySelector(`#${ticker}-${dte}`);
-
-            if (selectedTab) selectedTab.classList.add('active');
-            if (selectedPanel) selectedPanel.classList.add('active');
-        }
-
-        // Add startup notification
-        document.addEventListener('DOMContentLoaded', function() {
-            // Check if interactive service is running
-            fetch('http://localhost:5001/')
-            .then(response => {
-                if (response.ok) {
-                    console.log('✅ Interactive Analysis Service is running');
-                }
-            })
-            .catch(error => {
-                console.log('ℹ️ Interactive service not running. Start with: python src/web/interactive_web_service.py');
-            });
-        });
-    </script>
-</body>
-</html>'''
-        
-        # Create Jinja environment with custom filters
-        env = Environment()
-        env.filters['number_format'] = number_format
+        """Render the dashboard using template based on our mockup, as a buffered stream of chunks"""
+        dashboard_stream = self._get_dashboard_template().stream(**template_data)
+        dashboard_stream.enable_buffering(size=5)
+        return dashboard_stream
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_dashboard_template():
+        """Return the compiled dashboard template, loaded once per process"""
+        # auto_reload is off, so the environment would hand back this same object on every lookup anyway
+        return _template_env().get_template("dashboard.html")
 
-        template = env.from_string(template_str)
-        return template.render(**template_data)
\ No newline at end of file
@@ -0,0 +1,101 @@
+function openInteractiveAnalysis(ticker, direction) {
+    // Show loading indicator
+    const card = event.currentTarget;
+    const originalContent = card.innerHTML;
+    card.style.opacity = '0.7';
+    card.innerHTML = '<div style="text-align: center; padding: 40px;"><div style="color: #00ff88; font-size: 18px; margin-bottom: 10px;">\uD83E\uDD16</div><div>Creating analysis session...</div></div>';
+    
+    // Create analysis session
+    fetch('http://localhost:5001/api/create-session', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            ticker: ticker,
+            direction: direction
+        })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.error) {
+            alert('Error creating session: ' + data.error);
+            card.innerHTML = originalContent;
+            card.style.opacity = '1';
+        } else {
+            // Open analysis interface in new tab
+            window.open(`http://localhost:5001/analysis/${data.session_id}`, '_blank');
+            card.innerHTML = originalContent;
+            card.style.opacity = '1';
+        }
+    })
+    .catch(error => {
+        console.error('Error:', error);
+        alert('Error creating analysis session. Make sure the interactive service is running.');
+        card.innerHTML = originalContent;
+        card.style.opacity = '1';
+    });
+}
+
+function switchConsolidatedTab(ticker, dte) {
+    // Find all tabs and panels for this ticker
+    const card = document.querySelector(`[data-ticker="${ticker}"]`);
+    if (!card) return;
+
+    const tabs = card.querySelectorAll('.card-tab');
+    const panels = card.querySelectorAll('.timeframe-panel');
+
+    // Remove active class from all tabs and panels
+    tabs.forEach(tab => tab.classList.remove('active'));
+    panels.forEach(panel => panel.classList.remove('active'));
+
+    // Add active class to selected tab and panel
+    const selectedTab = card.querySelector(`[data-dte="${dte}"]`);
+    const selectedPanel = card.querySelector(`#${ticker}-${dte}`);
+
+    if (selectedTab) selectedTab.classList.add('active');
+    if (selectedPanel) selectedPanel.classList.add('active');
+}
+
+// Large recommendation tables arrive as JSON rows in the field order of _RECOMMENDATION_FIELDS
+function escapeHtml(value) {
+    return value.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;')
+        .replace(/"/g, '&#34;').replace(/'/g, '&#39;');
+}
+
+function renderRecommendations() {
+    const data = document.getElementById('recommendations-data');
+    if (!data) return;
+
+    // Build every row first and insert them with a single DOM update
+    const rows = JSON.parse(data.textContent).map(row => {
+        const [ticker, pattern, direction, directionClass, entry, target, expiry, successProb, probClass, riskReward] = row.map(escapeHtml);
+        return '<tr>' +
+            `<td class="ticker-cell">${ticker}</td>` +
+            `<td>${pattern}</td>` +
+            `<td><span class="direction-badge ${directionClass}">${direction}</span></td>` +
+            `<td>${entry}</td>` +
+            `<td>${target}</td>` +
+            `<td>${expiry}</td>` +
+            `<td class="probability-cell ${probClass}">${successProb}</td>` +
+            `<td>${riskReward}</td>` +
+            '</tr>\n';
+    });
+    document.querySelector('.recommendations-table tbody').insertAdjacentHTML('beforeend', rows.join(''));
+}
+
+// Add startup notification
+document.addEventListener('DOMContentLoaded', function() {
+    renderRecommendations();
+
+    // Check if interactive service is running
+    fetch('http://localhost:5001/')
+    .then(response => {
+        if (response.ok) {
+            console.log('\u2705 Interactive Analysis Service is running');
+        }
+    })
+    .catch(error => {
+        console.log('\u2139\uFE0F Interactive service not running. Start with: python src/web/interactive_web_service.py');
+    });
+});